@@ -0,0 +1,421 @@
+# _scripts/generate_feeds.py
+
+"""
+Generates feed.xml (Atom) and sitemap.xml in the site root from _posts/ and page front matter.
+
+The output follows the structure produced by jekyll-feed and jekyll-sitemap. Both
+plugins skip generation when the file already exists in the source tree, so running
+this script before `jekyll build` replaces their per-build work.
+
+Generation is incremental. Each post and page is stored in _tmpbkup/feed_cache.json
+with the digest of its source and its rendered <entry>/<url> fragments. Only files
+whose digest changed are parsed and re-rendered, and feed.xml/sitemap.xml are only
+rewritten when their content actually differs.
+
+Post content is rendered with the `markdown` package when it is installed; otherwise
+the raw Markdown is embedded in the feed entry. YAML, JSON, datetime and markdown are
+only imported once something has to be re-rendered, so a run where nothing changed
+only reads the cache and digests the sources.
+
+CLI flags:
+    -n / --dry-run    : Run against an in-memory overlay and report what would be written (diffs with -v)
+    -q / --quiet      : Suppress output except for errors
+    -v / --verbose    : Print which entries were re-rendered
+    --no-cache        : Ignore the cache and re-render every entry
+    --since REF       : Only re-check posts changed since the git ref
+    --changed-only    : Same as --since HEAD, including untracked posts
+"""
+
+import functools
+import os
+import re
+import sys
+from jekyll_utilities import (
+    FILENAME_DATE,
+    get_fs,
+    run_dry,
+    get_standard_parser,
+    get_changed_files_from_args,
+    load_markdown_files_safe,
+    load_yaml_file,
+    parse_sanitized_yaml,
+    parse_post_date,
+    build_post_url,
+    content_digest,
+    ensure_directory,
+    write_file_if_changed,
+)
+
+POSTS_DIR = "_posts"
+CATEGORY_DIR = "_category_pages"
+CONFIG_FILE = "_config.yml"
+FEED_FILE = "feed.xml"
+SITEMAP_FILE = "sitemap.xml"
+CACHE_FILE = "_tmpbkup/feed_cache.json"
+CACHE_VERSION = 1
+FEED_POSTS_LIMIT = 10
+EXCLUDED_PAGES = {"README.md", "404.html", FEED_FILE, SITEMAP_FILE}
+
+POST_URL_TAG = re.compile(r"\{%-?\s*post_url\s+(\S+?)\s*-?%\}")
+HTML_TAG = re.compile(r"<[^>]+>")
+
+def escape(text):
+    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def quoteattr(text):
+    return '"' + escape(text).replace('"', "&quot;") + '"'
+
+def get_timezone(name):
+    from datetime import timezone
+    if not name:
+        return timezone.utc
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(name)
+    except Exception:
+        return timezone.utc
+
+def to_datetime(value, tz):
+    """Return `value` as an aware datetime (naive values are taken to be in `tz`), or None when it is not a valid date."""
+    from datetime import datetime, time
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=tz)
+    try:
+        dt = datetime.fromisoformat(str(value))
+    except ValueError:
+        date = parse_post_date({"date": value})
+        if date is None:
+            return None
+        dt = datetime.combine(date, time())
+    return dt if dt.tzinfo else dt.replace(tzinfo=tz)
+
+def to_xmlschema(value, tz):
+    """Return `value` as an ISO 8601 timestamp in `tz`, or None when it is not a valid date."""
+    dt = to_datetime(value, tz)
+    return dt.isoformat() if dt else None
+
+def is_published(path, post, site, now=None):
+    """
+    Mirror Jekyll's publishing rules: skip `published: false` posts, and posts dated
+    after `now` (the build time) unless the site sets `future: true`.
+    """
+    from datetime import datetime, timezone
+    if post.metadata.get("published") is False:
+        return False
+    if site.get("future"):
+        return True
+    tz = get_timezone(site["timezone"])
+    date = to_datetime(post.metadata.get("date") or "", tz)
+    if date is None:
+        date = to_datetime(FILENAME_DATE.match(os.path.basename(path)).group(1), tz)
+    return date <= (now or datetime.now(timezone.utc))
+
+def absolute_url(site, path):
+    return site["url"].rstrip("/") + site["baseurl"].rstrip("/") + path
+
+def cdata(text):
+    return "<![CDATA[" + text.replace("]]>", "]]]]><![CDATA[>") + "]]>"
+
+@functools.lru_cache(maxsize=None)
+def _markdown_module():
+    try:
+        import markdown
+    except ImportError:  # optional dependency
+        return None
+    return markdown
+
+def render_markdown(text):
+    markdown = _markdown_module()
+    if markdown is None:
+        return text
+    return markdown.markdown(text, extensions=["fenced_code", "tables"])
+
+def build_excerpt(content):
+    first = content.strip().split("\n\n", 1)[0]
+    return " ".join(HTML_TAG.sub("", render_markdown(first)).split())
+
+def config_digest(config_file=CONFIG_FILE):
+    fs = get_fs()
+    if not fs.exists(config_file):
+        return ""
+    return content_digest(fs.read_bytes(config_file))
+
+def load_site(config_file=CONFIG_FILE):
+    config = load_yaml_file(config_file, default={}) or {}
+    author = config.get("author")
+    if isinstance(author, dict):
+        author = author.get("name")
+    return {
+        "title": str(config.get("title") or ""),
+        "description": str(config.get("description") or "").strip(),
+        "url": str(config.get("url") or ""),
+        "baseurl": str(config.get("baseurl") or ""),
+        "timezone": config.get("timezone") or "",
+        "author": author or "",
+        "future": config.get("future") is True,
+    }
+
+def render_post(path, post, site, post_urls):
+    metadata = post.metadata
+    tz = get_timezone(site["timezone"])
+    filename = os.path.basename(path)
+    url = build_post_url(filename, metadata)
+    link = absolute_url(site, url)
+    filename_date = FILENAME_DATE.match(filename).group(1)
+    published = to_xmlschema(metadata.get("date") or filename_date, tz)
+    if published is None:
+        print(f"[warn] {path}: unparseable date {metadata['date']}; using filename date", file=sys.stderr)
+        published = to_xmlschema(filename_date, tz)
+    updated = published
+    if metadata.get("last_modified_at"):
+        updated = to_xmlschema(metadata["last_modified_at"], tz)
+        if updated is None:
+            print(f"[warn] {path}: unparseable last_modified_at {metadata['last_modified_at']}", file=sys.stderr)
+            updated = published
+    title = " ".join(HTML_TAG.sub("", str(metadata.get("title") or "")).split())
+    links = {slug: post_urls.get(slug) for slug in POST_URL_TAG.findall(post.content)}
+    baseurl = site["baseurl"].rstrip("/")
+    content = POST_URL_TAG.sub(lambda m: baseurl + post_urls[m.group(1)] if post_urls.get(m.group(1)) else m.group(0), post.content)
+    author = metadata.get("author") or site["author"]
+    terms = list(metadata.get("categories") or []) + list(metadata.get("tags") or [])
+
+    entry = [
+        "<entry>",
+        f'<title type="html">{escape(title)}</title>',
+        f'<link href={quoteattr(link)} rel="alternate" type="text/html" title={quoteattr(title)} />',
+        f"<published>{published}</published>",
+        f"<updated>{updated}</updated>",
+        f"<id>{escape(absolute_url(site, url[:-len('.html')]))}</id>",
+        f'<content type="html" xml:base={quoteattr(link)}>{cdata(render_markdown(content).strip())}</content>',
+    ]
+    if author:
+        entry.append(f"<author><name>{escape(str(author))}</name></author>")
+    entry += [f"<category term={quoteattr(str(t))} />" for t in terms]
+    entry.append(f'<summary type="html">{cdata(build_excerpt(content))}</summary>')
+    entry.append("</entry>")
+
+    return {
+        "kind": "post",
+        "url": url,
+        "links": links,
+        "sort": f"{published}|{path}",
+        "updated": updated,
+        "feed": "\n".join(entry),
+        "sitemap": f"<url>\n<loc>{escape(link)}</loc>\n<lastmod>{updated}</lastmod>\n</url>",
+    }
+
+def page_url(path, metadata):
+    permalink = metadata.get("permalink")
+    if permalink:
+        return str(permalink)
+    name = os.path.splitext(os.path.basename(path))[0]
+    return "/" if name == "index" else f"/{name}.html"
+
+def render_page(path, post, site):
+    metadata = post.metadata
+    if metadata.get("sitemap") is False:
+        return None
+    loc = absolute_url(site, page_url(path, metadata).replace("/index.html", "/"))
+    lastmod = ""
+    if metadata.get("last_modified_at"):
+        modified = to_xmlschema(metadata["last_modified_at"], get_timezone(site["timezone"]))
+        if modified is None:
+            print(f"[warn] {path}: unparseable last_modified_at {metadata['last_modified_at']}", file=sys.stderr)
+        else:
+            lastmod = f"\n<lastmod>{modified}</lastmod>"
+    kind = "collection" if os.path.dirname(path) == CATEGORY_DIR else "page"
+    return {
+        "kind": kind,
+        "sort": path,
+        "sitemap": f"<url>\n<loc>{escape(loc)}</loc>{lastmod}\n</url>",
+    }
+
+def load_pages(paths):
+    for path in paths:
+        try:
+            metadata, content = parse_sanitized_yaml(get_fs().read_text(path))
+        except Exception as e:
+            print(f"[warn] Skipping {path}: {e}", file=sys.stderr)
+            continue
+        post = type("Post", (), {})()
+        post.metadata = metadata
+        post.content = content
+        yield path, post
+
+def has_front_matter(path):
+    return get_fs().read_text(path).split("\n", 1)[0].rstrip() == "---"
+
+def find_sources():
+    fs = get_fs()
+    posts = sorted(os.path.join(POSTS_DIR, f) for f in fs.listdir(POSTS_DIR) if f.endswith(".md"))
+    pages = []
+    if fs.isdir(CATEGORY_DIR):
+        pages += sorted(os.path.join(CATEGORY_DIR, f) for f in fs.listdir(CATEGORY_DIR) if f.endswith(".md"))
+    pages += sorted(
+        f for f in fs.listdir(".")
+        if f.endswith((".md", ".html")) and f not in EXCLUDED_PAGES and fs.isfile(f) and has_front_matter(f)
+    )
+    return posts, pages
+
+def build_feed(entries, site):
+    posts = sorted((e for e in entries.values() if e["kind"] == "post"), key=lambda e: e["sort"], reverse=True)
+    posts = posts[:FEED_POSTS_LIMIT]
+    updated = max((e["updated"] for e in posts), default="1970-01-01T00:00:00+00:00")
+    feed_url = absolute_url(site, f"/{FEED_FILE}")
+    lines = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        '<feed xmlns="http://www.w3.org/2005/Atom">',
+        '<generator uri="https://jekyllrb.com/">Jekyll</generator>',
+        f'<link href={quoteattr(feed_url)} rel="self" type="application/atom+xml" />',
+        f'<link href={quoteattr(absolute_url(site, "/"))} rel="alternate" type="text/html" />',
+        f"<updated>{updated}</updated>",
+        f"<id>{escape(feed_url)}</id>",
+        f'<title type="html">{escape(site["title"])}</title>',
+    ]
+    if site["description"]:
+        lines.append(f"<subtitle>{escape(site['description'])}</subtitle>")
+    if site["author"]:
+        lines.append(f"<author><name>{escape(str(site['author']))}</name></author>")
+    lines += [e["feed"] for e in posts]
+    lines.append("</feed>")
+    return "\n".join(lines) + "\n"
+
+def build_sitemap(entries):
+    order = {"post": 0, "collection": 1, "page": 2}
+    ordered = sorted(entries.values(), key=lambda e: (order[e["kind"]], e["sort"]))
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<urlset xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'xsi:schemaLocation="http://www.sitemaps.org/schemas/sitemap/0.9 '
+        'http://www.sitemaps.org/schemas/sitemap/0.9/sitemap.xsd" '
+        'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    lines += [e["sitemap"] for e in ordered]
+    lines.append("</urlset>")
+    return "\n".join(lines) + "\n"
+
+def load_cache(site_digest, cache_file=CACHE_FILE):
+    import json
+    try:
+        cache = json.loads(get_fs().read_text(cache_file))
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CACHE_VERSION or cache.get("site") != site_digest:
+        return {}
+    return cache.get("entries", {})
+
+def update_entries(cached, site=None, changed=None, now=None):
+    """
+    Return (entries, rendered) where `entries` maps every current source path to its
+    cached or freshly rendered fragments and `rendered` lists the paths that were re-rendered.
+    When `changed` is given, only those posts (and posts missing from the cache) are re-checked.
+    Posts Jekyll would not publish at `now` (default: the current time) are left out.
+    `site` is loaded from _config.yml only if something has to be rendered.
+    """
+    fs = get_fs()
+    posts, pages = find_sources()
+    digests, stale = {}, []
+    for path in posts + pages:
+        if changed is not None and path in cached and path.startswith(POSTS_DIR) and path not in changed:
+            continue
+        digests[path] = content_digest(fs.read_bytes(path))
+        if cached.get(path, {}).get("digest") != digests[path]:
+            stale.append(path)
+
+    entries = {p: cached[p] for p in posts + pages if p in cached and p not in stale}
+    if not stale:
+        return entries, []
+    site = site or load_site()
+
+    # post_url tags resolve against every post, so build the slug -> URL map from
+    # cached URLs plus the posts being re-rendered.
+    post_urls = {os.path.basename(p)[:-3]: e["url"] for p, e in entries.items() if e.get("url")}
+    parsed = dict(load_markdown_files_safe(POSTS_DIR, paths=[p for p in stale if p in posts]))
+    for path, post in parsed.items():
+        post_urls[os.path.basename(path)[:-3]] = build_post_url(os.path.basename(path), post.metadata)
+    parsed.update(load_pages([p for p in stale if p in pages]))
+
+    # Cached posts linking to a post whose URL changed (or disappeared) need re-rendering too.
+    relinked = [
+        p for p, e in entries.items()
+        if any(post_urls.get(slug) != url for slug, url in e.get("links", {}).items())
+    ]
+    parsed.update(load_markdown_files_safe(POSTS_DIR, paths=relinked))
+    stale += relinked
+
+    # Unpublished and future-dated posts are never cached, so they are re-checked
+    # on every run and appear once their date has passed.
+    unpublished = set()
+    for path in stale:
+        post = parsed.get(path)
+        if post is None:
+            entries.pop(path, None)
+            continue
+        if path in posts:
+            if not FILENAME_DATE.match(os.path.basename(path)):
+                print(f"[warn] Skipping {path}: filename has no date prefix", file=sys.stderr)
+                continue
+            if not is_published(path, post, site, now):
+                unpublished.add(path)
+                continue
+            entry = render_post(path, post, site, post_urls)
+        else:
+            entry = render_page(path, post, site)
+            if entry is None:
+                continue
+        entry["digest"] = digests.get(path) or cached[path]["digest"]
+        entries[path] = entry
+    return entries, [p for p in stale if p not in unpublished]
+
+def generate(args):
+    fs = get_fs()
+    site_digest = config_digest()
+    cached = {} if args.no_cache else load_cache(site_digest)
+
+    changed = None
+    changes = get_changed_files_from_args(args, POSTS_DIR)
+    if changes is not None:
+        changed = set(changes[0])
+
+    entries, rendered = update_entries(cached, changed=changed)
+    if args.verbose:
+        for path in rendered:
+            print(f"[info] Rendered {path}")
+        print(f"[info] {len(rendered)} of {len(entries)} entries re-rendered.")
+
+    if not rendered and set(entries) == set(cached) and fs.exists(FEED_FILE) and fs.exists(SITEMAP_FILE):
+        if args.verbose:
+            print("[info] No posts or pages changed; feed and sitemap left untouched")
+        return
+
+    site = load_site()
+    write_file_if_changed(FEED_FILE, build_feed(entries, site), quiet=args.quiet)
+    write_file_if_changed(SITEMAP_FILE, build_sitemap(entries), quiet=args.quiet)
+
+    import json
+    ensure_directory(os.path.dirname(CACHE_FILE))
+    cache = {
+        "version": CACHE_VERSION,
+        "site": site_digest,
+        "entries": entries,
+    }
+    write_file_if_changed(CACHE_FILE, json.dumps(cache, indent=2, sort_keys=True), quiet=True)
+
+def main():
+    parser = get_standard_parser("Generate feed.xml and sitemap.xml incrementally from _posts and pages")
+    parser.add_argument("--no-cache", action="store_true", help="Re-render every entry")
+    args = parser.parse_args()
+
+    if not get_fs().exists(POSTS_DIR):
+        print(f"[error] Missing {POSTS_DIR}/ directory", file=sys.stderr)
+        sys.exit(1)
+
+    if args.dry_run:
+        # Render into an in-memory overlay; the cache write is dropped with it.
+        quiet, args.quiet = args.quiet, True
+        run_dry(lambda: generate(args), quiet=quiet, verbose=args.verbose)
+    else:
+        generate(args)
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,14 @@ Utility functions for managing Jekyll content in the unattributed-theme project.
 This module provides reusable helpers for:
 - Parsing sanitized YAML front matter from markdown files
 - Normalizing category names to lowercase, filesystem-safe values
+- Resolving category aliases to canonical names from _data/category_aliases.yml
 - Building category permalinks and filenames
-- Writing files safely with change detection, dry-run support, and optional JSON validation
+- Building Jekyll post URLs from filename, date and categories
+- Writing files safely with change detection and optional JSON validation
+- Hashing content for digest-based change detection between runs
 - Providing a standardized argument parser for consistency across scripts
+- Routing file I/O through a swappable filesystem backend (disk, copy-on-write
+  overlay or in-memory tree) so dry runs and tests execute the real code path
 
 Used by automation tools in _scripts/ to validate, fix, and manage site content
 in line with GitHub Pages-compatible Jekyll requirements.
@@ -19,20 +24,282 @@ Supports common CLI flags:
     -v / --verbose    : Print detailed processing information
     -f / --fix        : Remove stale or unused output files
     -l / --list-new   : Show which files would be created without writing them
+    --since REF       : Only process files changed since the given git ref
+    --changed-only    : Only process files changed since HEAD (index, worktree, untracked)
 
 This module should remain lightweight and dependency-free, suitable for GitHub-hosted workflows.
+Modules that are slow to import (yaml, json, argparse, subprocess, hashlib, datetime) are
+imported inside the functions that need them, so short runs such as --list-new or fully
+cached runs do not pay for them. Simple `key: [a, b]` lines are read without YAML.
+
+All reads and writes go through get_fs(). The default DiskFS touches the real tree;
+OverlayFS keeps writes, renames and deletes in memory on top of another backend and
+reports them with changes(); MemoryFS is an overlay with nothing underneath. A dry
+run is the normal run inside run_dry(), which prints the overlay's changes afterwards
+(and a unified diff of each written file when verbose).
 """
 
-import argparse
-import hashlib
+import contextlib
 import os
 import re
 import sys
-import yaml
-import json
-from datetime import datetime
+import weakref
+
+FILENAME_DATE = re.compile(r"^(\d{4}-\d{2}-\d{2})-(.+)\.md$")
+CATEGORY_ALIASES_FILE = "_data/category_aliases.yml"
+SIMPLE_SCALAR = re.compile(r"^[A-Za-z_/][A-Za-z0-9_.+#/@ -]*$")
+SIMPLE_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*[ \t]*$")
+YAML_SPECIAL_SCALARS = {"true", "false", "yes", "no", "on", "off", "y", "n", "null", "~"}
+BACKUP_ROOT = "_tmpbkup"
+
+class DiskFS:
+    """Reads and writes the real filesystem."""
+
+    def read_bytes(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def read_text(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def write_bytes(self, path, data):
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def write_text(self, path, text):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def isfile(self, path):
+        return os.path.isfile(path)
+
+    def isdir(self, path):
+        return os.path.isdir(path)
+
+    def listdir(self, path):
+        return os.listdir(path)
+
+    def makedirs(self, path):
+        os.makedirs(path, exist_ok=True)
+
+    def remove(self, path):
+        os.remove(path)
+
+    def rename(self, src, dst):
+        os.rename(src, dst)
+
+    def copy(self, src, dst):
+        import shutil
+        shutil.copy2(src, dst)
+
+    def getmtime(self, path):
+        return os.path.getmtime(path)
+
+    def walk(self, top):
+        return os.walk(top)
+
+class OverlayFS:
+    """
+    Copy-on-write view of `base`: reads fall through to it until a path is written,
+    renamed or removed, and those changes are kept in memory. With base=None the
+    overlay is an empty in-memory tree.
+    """
+
+    def __init__(self, base=None):
+        self.base = base
+        self.generation = 0
+        self.files = {}
+        self.mtimes = {}
+        self.deleted = set()
+        self.children = {".": set()}
+
+    def _add_child(self, path):
+        parent = os.path.dirname(path) or "."
+        if parent == path:
+            return
+        if parent not in self.children:
+            self.children[parent] = set()
+            self._add_child(parent)
+        self.children[parent].add(os.path.basename(path))
+
+    def _in_base(self, path):
+        return self.base is not None and path not in self.deleted
+
+    def read_bytes(self, path):
+        path = os.path.normpath(path)
+        if path in self.files:
+            return self.files[path]
+        if not self._in_base(path):
+            raise FileNotFoundError(f"No such file: {path}")
+        return self.base.read_bytes(path)
+
+    def read_text(self, path):
+        path = os.path.normpath(path)
+        if path in self.files:
+            return self.files[path].decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        if not self._in_base(path):
+            raise FileNotFoundError(f"No such file: {path}")
+        return self.base.read_text(path)
+
+    def write_bytes(self, path, data):
+        import time
+        path = os.path.normpath(path)
+        if not self.isdir(os.path.dirname(path) or "."):
+            raise FileNotFoundError(f"No such directory: {os.path.dirname(path)}")
+        if self.isdir(path):
+            raise IsADirectoryError(f"Is a directory: {path}")
+        self.files[path] = bytes(data)
+        self.generation += 1
+        self.mtimes[path] = time.time()
+        self.deleted.discard(path)
+        self._add_child(path)
+
+    def write_text(self, path, text):
+        self.write_bytes(path, text.encode("utf-8"))
+
+    def exists(self, path):
+        return self.isfile(path) or self.isdir(path)
+
+    def isfile(self, path):
+        path = os.path.normpath(path)
+        return path in self.files or (self._in_base(path) and self.base.isfile(path))
+
+    def isdir(self, path):
+        path = os.path.normpath(path)
+        return path in self.children or (self.base is not None and self.base.isdir(path))
+
+    def listdir(self, path):
+        path = os.path.normpath(path)
+        if not self.isdir(path):
+            raise FileNotFoundError(f"No such directory: {path}")
+        names = set(self.children.get(path, ()))
+        if self.base is not None and self.base.isdir(path):
+            names.update(n for n in self.base.listdir(path) if os.path.normpath(os.path.join(path, n)) not in self.deleted)
+        return sorted(names)
+
+    def makedirs(self, path):
+        path = os.path.normpath(path)
+        if path not in self.children:
+            self.children[path] = set()
+            self._add_child(path)
+
+    def remove(self, path):
+        path = os.path.normpath(path)
+        if not self.isfile(path):
+            raise FileNotFoundError(f"No such file: {path}")
+        self.files.pop(path, None)
+        self.generation += 1
+        self.mtimes.pop(path, None)
+        self.children.get(os.path.dirname(path) or ".", set()).discard(os.path.basename(path))
+        if self.base is not None and self.base.isfile(path):
+            self.deleted.add(path)
+
+    def rename(self, src, dst):
+        if os.path.normpath(src) == os.path.normpath(dst):
+            return
+        mtime = self.getmtime(src)
+        self.write_bytes(dst, self.read_bytes(src))
+        self.mtimes[os.path.normpath(dst)] = mtime
+        self.remove(src)
+
+    def copy(self, src, dst):
+        if self.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        self.write_bytes(dst, self.read_bytes(src))
+        self.mtimes[os.path.normpath(dst)] = self.getmtime(src)
+
+    def getmtime(self, path):
+        path = os.path.normpath(path)
+        if path in self.mtimes:
+            return self.mtimes[path]
+        if not self._in_base(path):
+            raise FileNotFoundError(f"No such file: {path}")
+        return self.base.getmtime(path)
+
+    def walk(self, top):
+        if not self.isdir(top):
+            return
+        names = self.listdir(top)
+        dirs = [n for n in names if self.isdir(os.path.join(top, n))]
+        yield top, dirs, [n for n in names if n not in dirs]
+        for d in dirs:
+            yield from self.walk(os.path.join(top, d))
+
+    def changes(self):
+        """Return sorted (status, path) pairs, status being added, modified or deleted relative to the base."""
+        result = []
+        for path, data in self.files.items():
+            if self.base is not None and self.base.isfile(path):
+                if self.base.read_bytes(path) != data:
+                    result.append(("modified", path))
+            else:
+                result.append(("added", path))
+        result += [("deleted", path) for path in self.deleted if path not in self.files]
+        return sorted(result, key=lambda change: change[1])
+
+class MemoryFS(OverlayFS):
+    """In-memory tree, optionally seeded from a {path: text or bytes} mapping."""
+
+    def __init__(self, files=None):
+        super().__init__(base=None)
+        for path, data in (files or {}).items():
+            self.makedirs(os.path.dirname(path) or ".")
+            self.write_bytes(path, data.encode("utf-8") if isinstance(data, str) else data)
+
+_fs = DiskFS()
+
+def get_fs():
+    return _fs
+
+@contextlib.contextmanager
+def use_fs(fs):
+    """Route every helper and script through `fs` for the duration of the block."""
+    global _fs
+    previous, _fs = _fs, fs
+    try:
+        yield fs
+    finally:
+        _fs = previous
+
+def _overlay_diff(overlay, path):
+    """Unified diff lines of `path` from the overlay's base to the overlay."""
+    import difflib
+
+    def lines(fs):
+        if fs is None or not fs.isfile(path):
+            return []
+        return fs.read_bytes(path).decode("utf-8", errors="replace").splitlines()
+
+    return difflib.unified_diff(lines(overlay.base), lines(overlay), f"a/{path}", f"b/{path}", lineterm="")
+
+def run_dry(run, quiet=False, verbose=False, ignore=(BACKUP_ROOT,)):
+    """
+    Call run() against an OverlayFS over the current backend and print what it would
+    have written or deleted, leaving paths under `ignore` (backups, caches) out. With
+    `verbose`, each added or modified file is followed by its unified diff.
+    Returns (result, changes).
+    """
+    overlay = OverlayFS(get_fs())
+    with use_fs(overlay):
+        result = run()
+    changes = [
+        (status, path) for status, path in overlay.changes()
+        if not any(path == d or path.startswith(d + os.sep) for d in ignore)
+    ]
+    if not quiet:
+        for status, path in changes:
+            print(f"[dry-run] would {'delete' if status == 'deleted' else 'write'}: {path}")
+            if verbose and status != "deleted":
+                for line in _overlay_diff(overlay, path):
+                    print(line)
+    return result, changes
 
 def get_standard_parser(description="Process markdown files"):
+    import argparse
     parser = argparse.ArgumentParser(description=description)
     parser.add_argument("-n", "--dry-run", action="store_true", help="Run without writing changes")
     parser.add_argument("-q", "--quiet", action="store_true", help="Suppress output except for errors")
@@ -40,16 +307,176 @@ def get_standard_parser(description="Process markdown files"):
     parser.add_argument("-f", "--fix", action="store_true", help="Remove outdated files")
     parser.add_argument("-s", "--search", type=str, help="Keyword to search for in post content")
     parser.add_argument("-l", "--list-new", action="store_true", help="List new categories that will be created")
+    parser.add_argument("--since", type=str, metavar="REF", help="Only process files changed since the given git ref")
+    parser.add_argument("--changed-only", action="store_true", help="Only process files changed since HEAD")
     return parser
 
+def _git(*args):
+    import subprocess
+    result = subprocess.run(
+        ["git", "-c", "core.quotepath=off", *args],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+    return result.stdout
+
+def get_changed_files(directory, since="HEAD"):
+    """
+    Return (changed, deleted) lists of .md paths under `directory` that differ
+    from the git ref `since`, covering staged, unstaged and untracked files.
+    Renames report the new path as changed and the old path as deleted.
+    Returns None when the changed set cannot be determined.
+    """
+    try:
+        diff = _git("diff", "--name-status", "-z", "-M", "--relative", since, "--", directory)
+        untracked = _git("ls-files", "--others", "--exclude-standard", "-z", "--", directory)
+    except (OSError, RuntimeError) as e:
+        print(f"[warn] Cannot determine changed files ({e}); processing all files", file=sys.stderr)
+        return None
+
+    changed, deleted = set(), set()
+    tokens = diff.split("\0")
+    i = 0
+    while i < len(tokens) and tokens[i]:
+        status = tokens[i][0]
+        if status in "RC":
+            old, new = tokens[i + 1], tokens[i + 2]
+            if status == "R":
+                deleted.add(old)
+            changed.add(new)
+            i += 3
+            continue
+        path = tokens[i + 1]
+        (deleted if status == "D" else changed).add(path)
+        i += 2
+    changed.update(p for p in untracked.split("\0") if p)
+
+    def keep(paths):
+        return sorted(os.path.normpath(p) for p in paths if p.endswith(".md"))
+
+    return keep(changed), keep(deleted)
+
+def get_changed_files_from_args(args, directory):
+    """
+    Resolve --since / --changed-only into a (changed, deleted) tuple for `directory`.
+    Returns None when neither flag is set or git cannot answer, meaning a full run.
+    """
+    if not (args.since or args.changed_only):
+        return None
+    return get_changed_files(directory, since=args.since or "HEAD")
+
+def read_file_at_ref(path, ref="HEAD"):
+    """Return the content of `path` as of git `ref`, or None if it did not exist there."""
+    try:
+        return _git("show", f"{ref}:./{path}")
+    except (OSError, RuntimeError):
+        return None
+
 def parse_sanitized_yaml(raw: str):
     if raw.startswith("---"):
         _, fm, *rest = raw.split("---", 2)
         content = rest[0] if rest else ""
+        import yaml
         metadata = yaml.safe_load(fm)
         return metadata or {}, content.strip()
     raise ValueError("Missing YAML front matter")
 
+def parse_simple_list(value: str):
+    """
+    Parse a flow list (`[a, b]`) or single plain scalar without loading YAML.
+    Returns None when the value needs a real YAML parser to be read the same way.
+    """
+    value = value.strip()
+    if value.startswith("[") and value.endswith("]"):
+        inner = value[1:-1].strip()
+        items = [v.strip() for v in inner.split(",")] if inner else []
+    elif value:
+        items = [value]
+    else:
+        return None
+    parsed = []
+    for item in items:
+        if len(item) >= 2 and item[0] == item[-1] and item[0] in "\"'":
+            item = item[1:-1]
+            if any(c in item for c in "\\\"'"):
+                return None
+        elif not SIMPLE_SCALAR.match(item) or " #" in item or item.lower() in YAML_SPECIAL_SCALARS:
+            return None
+        parsed.append(item)
+    return parsed
+
+def _is_simple_front_matter(fm: str):
+    """
+    True when every line of `fm` is blank, a comment, or a top-level `key: value` whose
+    value YAML reads as written, so a missing key really is missing rather than hidden
+    behind a parse error.
+    """
+    for line in fm.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, sep, value = line.partition(":")
+        value = value.strip()
+        if not sep or not SIMPLE_KEY.match(key):
+            return False
+        if not value or parse_simple_list(value) is not None:
+            continue
+        if value[0] in "\"'":
+            if len(value) < 2 or value[-1] != value[0] or value[0] in value[1:-1] or "\\" in value:
+                return False
+        elif value[0] in "[]{}&*!|>?%@`#,-" or value.endswith(":") or ": " in value or " #" in value:
+            return False
+    return True
+
+def read_front_matter_list(raw: str, key: str):
+    """
+    Return the list stored under `key` in the front matter of `raw`, using the
+    YAML-free fast path when every line is simple and parse_sanitized_yaml() otherwise.
+    """
+    if raw.startswith("---"):
+        fm = raw.split("---", 2)[1]
+        if _is_simple_front_matter(fm):
+            matches = re.findall(rf"^{re.escape(key)}[ \t]*:(.*)$", fm, re.MULTILINE)
+            if not matches:
+                return []
+            value = parse_simple_list(matches[-1])
+            if value is not None:
+                return value
+    metadata, _ = parse_sanitized_yaml(raw)
+    value = metadata.get(key, [])
+    return [value] if isinstance(value, str) else value
+
+def load_yaml_file(path: str, default=None):
+    fs = get_fs()
+    if not fs.exists(path):
+        return default
+    import yaml
+    data = yaml.safe_load(fs.read_text(path))
+    return default if data is None else data
+
+def load_simple_mapping(path: str, default=None):
+    """
+    Load a YAML file made only of comments and `key: [a, b]` lines without importing
+    YAML, falling back to load_yaml_file() for anything else.
+    """
+    fs = get_fs()
+    if not fs.exists(path):
+        return default
+    data = {}
+    for line in fs.read_text(path).splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, sep, value = line.partition(":")
+        items = parse_simple_list(value) if sep and not line[0].isspace() else None
+        if items is None or not SIMPLE_SCALAR.match(key.strip()):
+            return load_yaml_file(path, default)
+        data[key.strip()] = items
+    return data or default
+
 def sanitize_filename(s: str) -> str:
     return re.sub(r"[^a-z0-9]+", "-", s.lower()).strip("-")
 
@@ -72,13 +499,13 @@ def write_markdown_file(path: str, post) -> None:
         lines.append(f"{key}: {value}")
     lines.append("---\n")
     lines.append(post.content or "")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    get_fs().write_text(path, "\n".join(lines))
 
 def ensure_directory(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
+    get_fs().makedirs(path)
 
 def validate_json(content: str) -> bool:
+    import json
     try:
         json.loads(content)
         return True
@@ -86,49 +513,123 @@ def validate_json(content: str) -> bool:
         print(f"Invalid JSON: {str(e)}", file=sys.stderr)
         return False
 
-def write_file_if_changed(path: str, content: str, dry_run=False, quiet=False, caller_handles_message=False):
+def content_digest(data) -> str:
+    import hashlib
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+def write_file_if_changed(path: str, content: str, quiet=False, caller_handles_message=False):
     if path.endswith(".json"):
+        import json
         try:
             json.loads(content)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON for {path}: {str(e)}")
 
-    old = ""
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            old = f.read()
+    fs = get_fs()
+    old = fs.read_text(path) if fs.exists(path) else ""
 
     changed = content.strip() != old.strip()
     message = ""
 
     if changed:
-        if dry_run:
-            message = f"[dry-run] would write: {path}"
-        else:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
-            message = f"[write] {path}"
+        fs.write_text(path, content)
+        message = f"[write] {path}"
 
     if changed and not caller_handles_message and not quiet:
         print(message)
 
     return changed, message
 
+def load_category_aliases(path: str = None) -> dict:
+    """
+    Load `canonical: [alias, ...]` entries and return an alias -> canonical mapping.
+    Names on both sides are normalized so lookups match normalize_category_name().
+    `path` defaults to CATEGORY_ALIASES_FILE, relative to the site root; a missing
+    table is reported once and treated as empty.
+    The table is cached per filesystem backend and re-read after an in-memory
+    backend has been written to, so an alias file edited in an overlay is seen.
+    """
+    fs = get_fs()
+    path = os.path.normpath(path or CATEGORY_ALIASES_FILE)
+    key = os.path.abspath(path)
+    generation = getattr(fs, "generation", 0)
+    cache = _alias_cache.setdefault(fs, {})
+    if key not in cache or cache[key][0] != generation:
+        cache[key] = (generation, _read_category_aliases(path, fs))
+    return cache[key][1]
+
+_alias_cache = weakref.WeakKeyDictionary()
+_missing_alias_tables = set()
+
+def _read_category_aliases(path: str, fs) -> dict:
+    if not fs.exists(path):
+        if os.path.abspath(path) not in _missing_alias_tables:
+            _missing_alias_tables.add(os.path.abspath(path))
+            print(f"[warn] No category alias table at {path}; aliases are not resolved", file=sys.stderr)
+        return {}
+    table = load_simple_mapping(path, default={})
+    if not isinstance(table, dict):
+        raise ValueError(f"{path} must map canonical categories to lists of aliases")
+    aliases = {}
+    for canonical, names in table.items():
+        canonical = str(canonical).lower()
+        if isinstance(names, str):
+            names = [names]
+        for name in names or []:
+            aliases[sanitize_filename(str(name))] = canonical
+            aliases[str(name).lower()] = canonical
+    return aliases
+
+def canonical_category_name(cat: str) -> str:
+    cat = str(cat).lower()
+    aliases = load_category_aliases()
+    return aliases.get(cat, aliases.get(sanitize_filename(cat), cat))
+
 def normalize_category_name(cat: str) -> str:
-    cat = cat.lower()
+    cat = canonical_category_name(cat)
     return {"c++": "cpp", "c#": "csharp"}.get(cat, sanitize_filename(cat))
 
 def build_category_permalink(cat: str) -> str:
     return f"/{normalize_category_name(cat)}-archive.html"
 
-def load_markdown_files_safe(directory):
-    for filename in os.listdir(directory):
-        if not filename.endswith(".md"):
+def parse_post_date(metadata):
+    from datetime import datetime
+    value = metadata.get("date")
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+def build_post_url(filename, metadata):
+    from datetime import datetime
+    match = FILENAME_DATE.match(filename)
+    if not match:
+        return None
+    if metadata.get("permalink"):
+        # A post's own permalink replaces the site-wide /:categories/:year/:month/:day/:title pattern.
+        return "/" + str(metadata["permalink"]).lstrip("/")
+    date = parse_post_date(metadata) or datetime.strptime(match.group(1), "%Y-%m-%d").date()
+    cats = metadata.get("categories") or []
+    if isinstance(cats, str):
+        cats = cats.split()
+    parts = list(dict.fromkeys(str(c).lower() for c in cats))
+    parts += [date.strftime("%Y"), date.strftime("%m"), date.strftime("%d"), f"{match.group(2)}.html"]
+    return "/" + "/".join(parts)
+
+def load_markdown_files_safe(directory, paths=None):
+    fs = get_fs()
+    if paths is None:
+        paths = [os.path.join(directory, f) for f in fs.listdir(directory)]
+    for path in paths:
+        filename = os.path.basename(path)
+        if not filename.endswith(".md") or not fs.exists(path):
             continue
-        path = os.path.join(directory, filename)
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                raw = f.read()
+            raw = fs.read_text(path)
             metadata, content = parse_sanitized_yaml(raw)
             if not metadata:
                 continue
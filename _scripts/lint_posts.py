@@ -0,0 +1,240 @@
+# _scripts/lint_posts.py
+
+"""
+Lints _posts/*.md for content problems that front matter normalization cannot fix.
+
+Every post is parsed once. A shared index is built up front with hash sets of
+valid post slugs, post URLs and archive permalinks (via build_category_permalink),
+plus title counts, so each rule answers its lookups in O(1). All registered rules
+then run over each post in a single pass, optionally spread across worker processes.
+
+Built-in rules:
+- broken-link        : post_url tags and internal links to posts/archive pages that do not exist
+- duplicate-title    : more than one post shares the same title
+- missing-category-page : a category has no _category_pages/<category>-archive.md entry
+- category-alias     : a category listed in _data/category_aliases.yml instead of its canonical name
+- malformed-date     : missing or unparseable front matter date, or filename date mismatch
+
+New rules are plain functions decorated with @rule("name"); they receive
+(path, metadata, content, index) and yield finding messages.
+
+CLI flags:
+    -q / --quiet      : Only print findings, no summary
+    -v / --verbose    : Print index and rule summary info
+    -j / --jobs N     : Run rules in N worker processes
+    --json            : Emit findings as a JSON array
+    --since REF       : Only lint posts changed since the git ref (index still covers all posts)
+    --changed-only    : Same as --since HEAD, including untracked posts
+
+Exits with status 1 when any finding is reported.
+"""
+
+import os
+import re
+import sys
+from collections import Counter
+from urllib.parse import urlsplit
+from jekyll_utilities import (
+    FILENAME_DATE,
+    get_fs,
+    get_standard_parser,
+    get_changed_files_from_args,
+    canonical_category_name,
+    build_post_url,
+    parse_post_date,
+    load_markdown_files_safe,
+    normalize_category_name,
+    build_category_permalink,
+    parse_sanitized_yaml,
+)
+
+POSTS_DIR = "_posts"
+CATEGORY_DIR = "_category_pages"
+CONFIG_FILE = "_config.yml"
+
+POST_URL_TAG = re.compile(r"\{%-?\s*post_url\s+(\S+?)\s*-?%\}")
+LINK_TARGET = re.compile(r"\]\(\s*<?([^)\s>]+)|href=[\"']([^\"']+)[\"']")
+POST_PERMALINK = re.compile(r"^/(?:[^/]+/)*\d{4}/\d{2}/\d{2}/[^/]+\.html$")
+ARCHIVE_PERMALINK = re.compile(r"^/[^/]+-archive\.html$")
+
+RULES = []
+
+def rule(name):
+    def register(fn):
+        fn.rule_name = name
+        RULES.append(fn)
+        return fn
+    return register
+
+def load_site_host(config_file=CONFIG_FILE):
+    fs = get_fs()
+    if not fs.exists(config_file):
+        return ""
+    try:
+        url = re.search(r"^url:\s*[\"']?([^\"'\s]+)", fs.read_text(config_file), re.MULTILINE)
+        return urlsplit(url.group(1)).netloc if url else ""
+    except OSError:
+        return ""
+
+def load_category_pages(category_dir=CATEGORY_DIR):
+    fs = get_fs()
+    categories = set()
+    if not fs.isdir(category_dir):
+        return categories
+    for fname in fs.listdir(category_dir):
+        if not fname.endswith(".md"):
+            continue
+        try:
+            metadata, _ = parse_sanitized_yaml(fs.read_text(os.path.join(category_dir, fname)))
+            categories.add(normalize_category_name(str(metadata.get("category", fname[:-len("-archive.md")]))))
+        except Exception as e:
+            print(f"[warn] Skipping {fname}: {e}", file=sys.stderr)
+    return categories
+
+def build_index(posts, category_dir=CATEGORY_DIR, site_host=""):
+    index = {
+        "post_slugs": set(),
+        "post_urls": set(),
+        "category_pages": load_category_pages(category_dir),
+        "titles": Counter(),
+        "site_host": site_host,
+    }
+    index["archive_permalinks"] = {build_category_permalink(c) for c in index["category_pages"]}
+    for path, metadata, _ in posts:
+        filename = os.path.basename(path)
+        index["post_slugs"].add(filename[:-3])
+        url = build_post_url(filename, metadata)
+        if url:
+            index["post_urls"].add(url)
+        title = str(metadata.get("title") or "").strip().lower()
+        if title:
+            index["titles"][title] += 1
+    return index
+
+def internal_link_path(target, site_host):
+    parts = urlsplit(target)
+    if parts.scheme or parts.netloc:
+        if parts.netloc != site_host or not site_host:
+            return None
+    if not parts.path.startswith("/"):
+        return None
+    return parts.path
+
+@rule("broken-link")
+def check_links(path, metadata, content, index):
+    for slug in POST_URL_TAG.findall(content):
+        if slug not in index["post_slugs"]:
+            yield f"post_url target not found: {slug}"
+    for groups in LINK_TARGET.findall(content):
+        link = internal_link_path(groups[0] or groups[1], index["site_host"])
+        if link is None:
+            continue
+        if ARCHIVE_PERMALINK.match(link):
+            if link not in index["archive_permalinks"]:
+                yield f"archive link not found: {link}"
+        elif POST_PERMALINK.match(link) and link not in index["post_urls"]:
+            yield f"post link not found: {link}"
+
+@rule("duplicate-title")
+def check_duplicate_title(path, metadata, content, index):
+    title = str(metadata.get("title") or "").strip()
+    if title and index["titles"][title.lower()] > 1:
+        yield f"title shared with {index['titles'][title.lower()] - 1} other post(s): {title}"
+
+@rule("missing-category-page")
+def check_category_pages(path, metadata, content, index):
+    cats = metadata.get("categories") or []
+    if isinstance(cats, str):
+        cats = [cats]
+    for cat in cats:
+        if normalize_category_name(str(cat)) not in index["category_pages"]:
+            yield f"no {CATEGORY_DIR} entry for category: {cat}"
+
+@rule("category-alias")
+def check_category_alias(path, metadata, content, index):
+    cats = metadata.get("categories") or []
+    if isinstance(cats, str):
+        cats = [cats]
+    for cat in cats:
+        canonical = canonical_category_name(str(cat))
+        if canonical != str(cat).lower():
+            yield f"category {cat} is an alias of {canonical}"
+
+@rule("malformed-date")
+def check_date(path, metadata, content, index):
+    if "date" not in metadata:
+        yield "missing front matter date"
+        return
+    date = parse_post_date(metadata)
+    if date is None:
+        yield f"unparseable front matter date: {metadata['date']}"
+        return
+    match = FILENAME_DATE.match(os.path.basename(path))
+    if not match:
+        yield "filename does not start with YYYY-MM-DD-"
+    elif match.group(1) != date.isoformat():
+        yield f"filename date {match.group(1)} does not match front matter date {date.isoformat()}"
+
+_worker_index = None
+
+def _init_worker(index):
+    global _worker_index
+    _worker_index = index
+
+def lint_post(post, index=None):
+    index = _worker_index if index is None else index
+    path, metadata, content = post
+    findings = []
+    for fn in RULES:
+        for message in fn(path, metadata, content, index):
+            findings.append({"rule": fn.rule_name, "path": path, "message": message})
+    return findings
+
+def lint_posts(posts, index, jobs=1, paths=None):
+    if paths is not None:
+        wanted = {os.path.normpath(p) for p in paths}
+        posts = [p for p in posts if p[0] in wanted]
+    targets = posts
+    if jobs > 1 and len(targets) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(index,)) as pool:
+            results = pool.map(lint_post, targets, chunksize=max(1, len(targets) // (jobs * 4)))
+            return [f for findings in results for f in findings]
+    return [f for post in targets for f in lint_post(post, index)]
+
+def main():
+    parser = get_standard_parser("Lint _posts/*.md for broken links, duplicate titles, missing category pages and bad dates")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of worker processes")
+    parser.add_argument("--json", action="store_true", help="Emit findings as JSON")
+    args = parser.parse_args()
+
+    if not get_fs().exists(POSTS_DIR):
+        print(f"[error] Missing {POSTS_DIR}/ directory", file=sys.stderr)
+        sys.exit(1)
+
+    posts = [(os.path.normpath(path), post.metadata, post.content) for path, post in load_markdown_files_safe(POSTS_DIR)]
+    index = build_index(posts, site_host=load_site_host())
+    if args.verbose:
+        print(f"[info] Indexed {len(index['post_urls'])} post URLs and {len(index['archive_permalinks'])} archive permalinks.")
+
+    paths = None
+    changes = get_changed_files_from_args(args, POSTS_DIR)
+    if changes is not None:
+        paths, _ = changes
+
+    findings = lint_posts(posts, index, jobs=args.jobs, paths=paths)
+
+    if args.json:
+        import json
+        print(json.dumps(findings, indent=2))
+    else:
+        for finding in findings:
+            print(f"[{finding['rule']}] {finding['path']}: {finding['message']}")
+        if not args.quiet:
+            print(f"[info] {len(findings)} findings across {len(RULES)} rules.")
+
+    if findings:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
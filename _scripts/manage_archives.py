@@ -13,26 +13,37 @@ would be created, supporting safe use during development or automation.
 
 Key features:
 - Scans all post files for unique categories (normalized to lowercase)
+- Resolves category aliases from _data/category_aliases.yml so only canonical pages exist
+- Suggests new alias candidates by normalized edit distance and post overlap
 - Generates matching _category_pages/<category>-archive.md files
 - Validates and updates only when changes are detected
 - Supports backup and cleanup of outdated category files
 
 CLI flags:
-    -n / --dry-run    : Simulate file creation and deletion without writing
+    -n / --dry-run    : Run against an in-memory overlay and print the files it would change (diffs with -v)
     -q / --quiet      : Suppress all non-critical output
     -v / --verbose    : Print detailed progress and summary info
     -f / --fix        : Remove category pages no longer referenced by posts
     -l / --list-new   : Show which category pages would be created (no writes)
+    --suggest-aliases : Print likely duplicate categories to add to the alias table
+    --since REF       : Only add/remove pages for posts changed since the git ref
+    --changed-only    : Same as --since HEAD, including untracked posts
 
 Designed to integrate with other content validation tools in the unattributed-theme project.
 """
 
 import os
+import re
 import sys
-import shutil
 from jekyll_utilities import (
+    get_fs,
+    run_dry,
     get_standard_parser,
-    parse_sanitized_yaml,
+    get_changed_files_from_args,
+    read_file_at_ref,
+    canonical_category_name,
+    load_category_aliases,
+    read_front_matter_list,
     normalize_category_name,
     build_category_permalink,
     write_file_if_changed,
@@ -42,25 +53,121 @@ from jekyll_utilities import (
 CATEGORY_DIR = "_category_pages"
 POSTS_DIR = "_posts"
 BACKUP_DIR = "_tmpbkup/_category_pages"
+ALIAS_NAME_THRESHOLD = 0.8
+ALIAS_OVERLAP_NAME_THRESHOLD = 0.6
+ALIAS_OVERLAP_THRESHOLD = 0.5
+ALIAS_ABBREVIATION_SIMILARITY = 0.85
 
-def extract_all_categories(post_dir):
+def categories_from_raw(raw, resolve_aliases=True):
+    cats = read_front_matter_list(raw, "categories")
+    if resolve_aliases:
+        cats = [canonical_category_name(c) for c in cats]
+    return cats
+
+def extract_all_categories(post_dir, paths=None):
+    fs = get_fs()
     categories = set()
-    for fname in os.listdir(post_dir):
-        if not fname.endswith(".md"):
+    if paths is None:
+        paths = [os.path.join(post_dir, f) for f in fs.listdir(post_dir)]
+    for path in paths:
+        fname = os.path.basename(path)
+        if not fname.endswith(".md") or not fs.exists(path):
             continue
-        path = os.path.join(post_dir, fname)
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                raw = f.read()
-            metadata, _ = parse_sanitized_yaml(raw)
-            cats = metadata.get("categories", [])
-            if isinstance(cats, str):
-                cats = [cats]
-            categories.update(cats)
+            categories.update(categories_from_raw(fs.read_text(path)))
         except Exception as e:
             print(f"[warn] Skipping {fname}: {e}", file=sys.stderr)
     return sorted(categories)
 
+def extract_categories_at_ref(paths, ref):
+    categories = set()
+    for path in paths:
+        raw = read_file_at_ref(path, ref)
+        if raw is None:
+            continue
+        try:
+            categories.update(categories_from_raw(raw))
+        except Exception as e:
+            print(f"[warn] Skipping {path}@{ref}: {e}", file=sys.stderr)
+    return sorted(categories)
+
+def extract_posts_by_category(post_dir):
+    fs = get_fs()
+    posts_by_category = {}
+    for fname in sorted(fs.listdir(post_dir)):
+        if not fname.endswith(".md"):
+            continue
+        try:
+            cats = categories_from_raw(fs.read_text(os.path.join(post_dir, fname)), resolve_aliases=False)
+        except Exception as e:
+            print(f"[warn] Skipping {fname}: {e}", file=sys.stderr)
+            continue
+        for cat in cats:
+            posts_by_category.setdefault(str(cat).lower(), set()).add(fname)
+    return posts_by_category
+
+def edit_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+def is_subsequence(short, long):
+    chars = iter(long)
+    return all(c in chars for c in short)
+
+def name_similarity(a, b):
+    """
+    Normalized edit-distance similarity of two category names, ignoring separators.
+    Hyphen tokens shared by both names are compared only by their differing parts, and
+    a name whose tokens are a subset of the other's (security vs ai-security) is treated
+    as a broader topic, not a duplicate. Abbreviations that keep the first three letters
+    (pentesting vs penetration-testing) score at least ALIAS_ABBREVIATION_SIMILARITY.
+    """
+    tokens_a, tokens_b = a.split("-"), b.split("-")
+    shared = set(tokens_a) & set(tokens_b)
+    if shared:
+        if set(tokens_a) <= set(tokens_b) or set(tokens_b) <= set(tokens_a):
+            return 0.0
+        tokens_a = [t for t in tokens_a if t not in shared]
+        tokens_b = [t for t in tokens_b if t not in shared]
+    a = re.sub(r"[^a-z0-9]", "", "".join(tokens_a))
+    b = re.sub(r"[^a-z0-9]", "", "".join(tokens_b))
+    if not a or not b:
+        return 0.0
+    score = 1.0 - edit_distance(a, b) / max(len(a), len(b))
+    short, long = sorted((a, b), key=len)
+    if len(short) >= 4 and short[:3] == long[:3] and is_subsequence(short, long):
+        score = max(score, ALIAS_ABBREVIATION_SIMILARITY)
+    return score
+
+def suggest_category_aliases(posts_by_category, aliases=None):
+    """
+    Return (alias, canonical, name_similarity, post_overlap) tuples for category pairs that
+    look like duplicates: names at least ALIAS_NAME_THRESHOLD similar, or at least
+    ALIAS_OVERLAP_NAME_THRESHOLD similar while sharing ALIAS_OVERLAP_THRESHOLD of their posts.
+    The more widely used name (preferring hyphenated names on ties) is proposed as canonical;
+    names already in the alias table are skipped.
+    """
+    aliases = load_category_aliases() if aliases is None else aliases
+    names = sorted(n for n in posts_by_category if n not in aliases)
+    suggestions = []
+    for i, a in enumerate(names):
+        for b in names[i + 1:]:
+            similarity = name_similarity(a, b)
+            if similarity < ALIAS_OVERLAP_NAME_THRESHOLD:
+                continue
+            posts_a, posts_b = posts_by_category[a], posts_by_category[b]
+            overlap = len(posts_a & posts_b) / len(posts_a | posts_b)
+            if similarity < ALIAS_NAME_THRESHOLD and overlap < ALIAS_OVERLAP_THRESHOLD:
+                continue
+            canonical, alias = sorted((a, b), key=lambda n: (-len(posts_by_category[n]), "-" not in n, n))
+            suggestions.append((alias, canonical, round(similarity, 2), round(overlap, 2)))
+    return sorted(suggestions, key=lambda s: (-s[2], -s[3], s[0]))
+
 def generate_category_filename(category):
     normalized = normalize_category_name(category)
     return f"{normalized}-archive.md"
@@ -85,15 +192,22 @@ def build_content(front_matter):
     return "\n".join(lines)
 
 def backup_file_if_exists(filepath):
-    if os.path.exists(filepath):
+    fs = get_fs()
+    if fs.exists(filepath):
         ensure_directory(BACKUP_DIR)
-        shutil.copy2(filepath, os.path.join(BACKUP_DIR, os.path.basename(filepath)))
+        fs.copy(filepath, os.path.join(BACKUP_DIR, os.path.basename(filepath)))
 
-def main():
-    parser = get_standard_parser("Regenerate _category_pages/*.md from categories in _posts")
-    args = parser.parse_args()
+def update_archives(args):
+    fs = get_fs()
+    changes = get_changed_files_from_args(args, POSTS_DIR)
+    if changes is None:
+        found_categories = extract_all_categories(POSTS_DIR)
+    else:
+        changed, deleted = changes
+        found_categories = extract_all_categories(POSTS_DIR, paths=changed)
+        if args.verbose:
+            print(f"[info] {len(changed)} changed and {len(deleted)} deleted posts since {args.since or 'HEAD'}.")
 
-    found_categories = extract_all_categories(POSTS_DIR)
     if args.verbose:
         print(f"[info] Found {len(found_categories)} unique categories.")
 
@@ -105,31 +219,51 @@ def main():
         content = build_content(expected)
 
         if args.list_new:
-            if not os.path.exists(path):
+            if not fs.exists(path):
                 print(f"[new] {filename}")
             continue
 
         backup_file_if_exists(path)
-        write_file_if_changed(path, content, dry_run=args.dry_run, quiet=args.quiet)
+        write_file_if_changed(path, content, quiet=args.quiet)
         generated_files.add(filename)
 
-    if args.dry_run and not args.quiet:
-        print("[dry-run] archive pages updated")
-    elif not args.dry_run and args.verbose:
+    if args.verbose and not args.list_new:
         print("[info] archive pages updated")
 
     if args.fix:
-        for filename in os.listdir(CATEGORY_DIR):
-            if filename.endswith(".md") and filename not in generated_files:
-                full_path = os.path.join(CATEGORY_DIR, filename)
-                if args.dry_run:
-                    if not args.quiet:
-                        print(f"[dry-run] would delete {full_path}")
-                else:
-                    backup_file_if_exists(full_path)
-                    os.remove(full_path)
-                    if not args.quiet:
-                        print(f"[delete] {full_path}")
+        if changes is None:
+            candidates = fs.listdir(CATEGORY_DIR)
+        else:
+            # Only pages for categories the changed/deleted posts used to carry can
+            # have become orphaned; confirming that needs the full category set.
+            previous = extract_categories_at_ref(changed + deleted, args.since or "HEAD")
+            candidates = {generate_category_filename(c) for c in previous} - generated_files
+            if candidates:
+                generated_files = {generate_category_filename(c) for c in extract_all_categories(POSTS_DIR)}
+        for filename in sorted(candidates):
+            full_path = os.path.join(CATEGORY_DIR, filename)
+            if filename.endswith(".md") and filename not in generated_files and fs.exists(full_path):
+                backup_file_if_exists(full_path)
+                fs.remove(full_path)
+                if not args.quiet:
+                    print(f"[delete] {full_path}")
+
+def main():
+    parser = get_standard_parser("Regenerate _category_pages/*.md from categories in _posts")
+    parser.add_argument("--suggest-aliases", action="store_true", help="Print likely duplicate categories")
+    args = parser.parse_args()
+
+    if args.suggest_aliases:
+        for alias, canonical, similarity, overlap in suggest_category_aliases(extract_posts_by_category(POSTS_DIR)):
+            print(f"[suggest] {alias} -> {canonical} (name similarity {similarity}, post overlap {overlap})")
+        return
+
+    if args.dry_run:
+        # The real run executes against an in-memory overlay; only its diff is printed.
+        quiet, args.quiet = args.quiet, True
+        run_dry(lambda: update_archives(args), quiet=quiet, verbose=args.verbose)
+    else:
+        update_archives(args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,392 @@
+# _scripts/minify_site.py
+
+"""
+Minifies the generated _site/**/*.html after a Jekyll build.
+
+Templates in _layouts/ and _includes/ leave indentation, blank lines and HTML
+comments in every rendered page, and the search page carries a large inline
+posts array. This post-build stage removes that overhead without changing what
+the browser renders:
+
+- HTML comments are dropped (conditional `<!--[if ...]>` and `<!--! ...-->` comments are kept)
+- Whitespace runs in text collapse to one space; whitespace-only gaps next to block-level tags are removed
+- `<pre>`, `<code>`, `<textarea>` and `<style>` blocks and all tag markup are copied verbatim
+- Inline JSON scripts are re-serialized compactly; inline JavaScript has comments and
+  insignificant whitespace removed while line breaks that could matter for ASI are kept
+
+After minifying, every `<pre>`/`<code>`/`<textarea>` block is compared byte-for-byte
+with the original; on any mismatch the page is left untouched and a warning is printed.
+
+Pages are processed in a process pool when reading the real disk, and in-process
+under the in-memory backends of jekyll_utilities. Dry runs keep their own per-page
+flag instead of an overlay so the savings summary still works in the pool.
+
+_tmpbkup/minify_cache.json maps each page to the digest of the page Jekyll built
+(input) and of its minified form (output); the minified bytes are stored once per
+output digest under _tmpbkup/minify_cache/. After a rebuild, a page whose input
+digest is unchanged is restored from the stored output without minifying it again,
+and a page that is already minified is skipped. Stored outputs no longer referenced
+by any page are removed.
+A summary of bytes saved per page type (post, archive, search, index, page) is printed.
+
+CLI flags:
+    -n / --dry-run    : Report savings without writing pages, stored outputs or the cache
+    -q / --quiet      : Suppress output except for errors and warnings
+    -v / --verbose    : Print per-file results
+    -j / --jobs N     : Number of worker processes (default: CPU count)
+    --site-dir DIR    : Built site directory (default: _site)
+    --no-cache        : Ignore the cache and minify every page
+"""
+
+import os
+import re
+import sys
+from jekyll_utilities import (
+    DiskFS,
+    get_fs,
+    get_standard_parser,
+    content_digest,
+    ensure_directory,
+    write_file_if_changed,
+)
+
+SITE_DIR = "_site"
+CACHE_FILE = "_tmpbkup/minify_cache.json"
+OUTPUT_DIR = "_tmpbkup/minify_cache"
+
+SEGMENT = re.compile(
+    r"(?P<comment><!--.*?-->)"
+    r"|(?P<preserved><(?P<ptag>pre|textarea|code|style)\b[^>]*>.*?</(?P=ptag)\s*>)"
+    r"|(?P<script><script\b(?P<sattrs>[^>]*)>(?P<sbody>.*?)</script\s*>)"
+    r"|(?P<tag></?[A-Za-z!][^>]*>)",
+    re.S | re.I,
+)
+VERBATIM_BLOCK = re.compile(r"<(pre|textarea|code)\b[^>]*>.*?</\1\s*>", re.S | re.I)
+TAG_NAME = re.compile(r"<[/!]?([A-Za-z0-9]+)")
+SCRIPT_TYPE = re.compile(r"\btype\s*=\s*[\"']?([^\"'\s>]+)", re.I)
+WHITESPACE = re.compile(r"\s+")
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "body", "br", "dd", "details", "div",
+    "dl", "doctype", "dt", "fieldset", "figcaption", "figure", "footer", "form", "h1",
+    "h2", "h3", "h4", "h5", "h6", "head", "header", "hr", "html", "li", "link", "main",
+    "meta", "nav", "noscript", "ol", "option", "p", "section", "summary", "table",
+    "tbody", "td", "tfoot", "th", "thead", "title", "tr", "ul",
+}
+JSON_TYPES = {"application/json", "application/ld+json"}
+JS_TYPES = {"", "text/javascript", "application/javascript", "module"}
+
+JS_WS = " \t\r\n\f\v"
+REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+REGEX_KEYWORDS = {
+    "return", "typeof", "case", "do", "else", "in", "of", "new", "delete",
+    "void", "throw", "yield", "await", "instanceof",
+}
+NO_NEWLINE_AFTER = set("{[(,;")
+NO_NEWLINE_BEFORE = set("}]),;")
+
+def is_word_char(c):
+    return c.isalnum() or c in "_$\\" or ord(c) > 127
+
+def _read_quoted(code, i, quote):
+    j = i + 1
+    while j < len(code):
+        if code[j] == "\\":
+            j += 2
+            continue
+        if code[j] == quote:
+            return j + 1
+        if code[j] == "\n" and quote != "`":
+            return -1
+        j += 1
+    return -1
+
+def _read_regex(code, i):
+    j, in_class = i + 1, False
+    while j < len(code):
+        c = code[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == "\n":
+            return -1
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            j += 1
+            while j < len(code) and is_word_char(code[j]):
+                j += 1
+            return j
+        j += 1
+    return -1
+
+def minify_js(code):
+    """Strip comments and insignificant whitespace; returns `code` unchanged if it cannot tokenize it."""
+    out = []
+    last, last_word, pending = "", "", ""
+    i, n = 0, len(code)
+    while i < n:
+        c = code[i]
+        if c in JS_WS:
+            j = i
+            while j < n and code[j] in JS_WS:
+                j += 1
+            pending = "\n" if "\n" in code[i:j] or pending == "\n" else " "
+            i = j
+            continue
+        if code.startswith("//", i):
+            j = code.find("\n", i)
+            i = n if j == -1 else j
+            continue
+        if code.startswith("/*", i):
+            j = code.find("*/", i + 2)
+            if j == -1:
+                return code
+            pending = "\n" if "\n" in code[i:j] or pending == "\n" else (pending or " ")
+            i = j + 2
+            continue
+
+        if c in "'\"`":
+            end = _read_quoted(code, i, c)
+        elif c == "/" and (not last or last in REGEX_PRECEDERS or last_word in REGEX_KEYWORDS):
+            end = _read_regex(code, i)
+        elif is_word_char(c):
+            end = i
+            while end < n and is_word_char(code[end]):
+                end += 1
+        else:
+            end = i + 1
+        if end == -1:
+            return code
+        token = code[i:end]
+
+        if pending and last:
+            first = token[0]
+            if pending == "\n":
+                if last not in NO_NEWLINE_AFTER and first not in NO_NEWLINE_BEFORE:
+                    out.append("\n")
+            elif (is_word_char(last) and is_word_char(first)) \
+                    or (last in "+-/" and first == last) \
+                    or (last.isdigit() and first == "."):
+                out.append(" ")
+        out.append(token)
+        last = token[-1]
+        last_word = token if is_word_char(c) else ""
+        pending = ""
+        i = end
+    return "".join(out)
+
+def minify_json(body):
+    import json
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
+
+def minify_script(match):
+    attrs, body = match.group("sattrs"), match.group("sbody")
+    type_match = SCRIPT_TYPE.search(attrs)
+    script_type = type_match.group(1).lower() if type_match else ""
+    if script_type in JSON_TYPES:
+        body = minify_json(body)
+    elif script_type in JS_TYPES and body.strip():
+        body = minify_js(body)
+    return f"<script{attrs}>{body}</script>"
+
+def _tag_name(piece):
+    match = TAG_NAME.match(piece)
+    return match.group(1).lower() if match else ""
+
+def minify_html(html):
+    pieces = []  # (kind, text)
+    pos = 0
+    for match in SEGMENT.finditer(html):
+        if match.start() > pos:
+            pieces.append(("text", html[pos:match.start()]))
+        pos = match.end()
+        if match.group("comment"):
+            comment = match.group("comment")
+            if comment.startswith("<!--[if") or comment.startswith("<!--!"):
+                pieces.append(("tag", comment))
+            continue
+        if match.group("preserved"):
+            pieces.append(("tag", match.group("preserved")))
+        elif match.group("script"):
+            pieces.append(("tag", minify_script(match)))
+        else:
+            pieces.append(("tag", match.group("tag")))
+    if pos < len(html):
+        pieces.append(("text", html[pos:]))
+
+    # Merge text split by dropped comments before collapsing whitespace.
+    merged = []
+    for kind, text in pieces:
+        if kind == "text" and merged and merged[-1][0] == "text":
+            merged[-1] = ("text", merged[-1][1] + text)
+        else:
+            merged.append((kind, text))
+
+    out = []
+    for i, (kind, text) in enumerate(merged):
+        if kind == "text":
+            text = WHITESPACE.sub(" ", text)
+            if text == " ":
+                prev_tag = _tag_name(merged[i - 1][1]) if i > 0 else "doctype"
+                next_tag = _tag_name(merged[i + 1][1]) if i + 1 < len(merged) else "html"
+                if prev_tag in BLOCK_TAGS or next_tag in BLOCK_TAGS:
+                    continue
+        out.append(text)
+    return "".join(out).strip() + "\n"
+
+def verbatim_blocks(html):
+    return [m.group(0) for m in VERBATIM_BLOCK.finditer(html)]
+
+def classify_page(relpath):
+    name = os.path.basename(relpath)
+    if name.startswith("search"):
+        return "search"
+    if name.endswith("-archive.html"):
+        return "archive"
+    if re.search(r"(^|/)\d{4}/\d{2}/\d{2}/", relpath.replace(os.sep, "/")):
+        return "post"
+    if name == "index.html":
+        return "index"
+    return "page"
+
+def stored_output_path(digest):
+    return os.path.join(OUTPUT_DIR, f"{digest}.html")
+
+def process_page(task):
+    path, relpath, cached, dry_run = task
+    result = {"path": relpath, "type": classify_page(relpath), "status": "skipped", "before": 0, "after": 0}
+    fs = get_fs()
+    raw = fs.read_bytes(path)
+    result["before"] = result["after"] = len(raw)
+    result["input"] = result["output"] = content_digest(raw)
+    if cached and result["input"] == cached["output"]:
+        result["input"] = cached["input"]
+        return result
+
+    if cached and result["input"] == cached["input"] and fs.exists(stored_output_path(cached["output"])):
+        data = fs.read_bytes(stored_output_path(cached["output"]))
+        if content_digest(data) == cached["output"]:
+            result["after"] = len(data)
+            result["output"] = cached["output"]
+            result["status"] = "restored"
+            if not dry_run:
+                fs.write_bytes(path, data)
+            return result
+
+    try:
+        html = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        result["status"] = "error"
+        result["message"] = "not valid UTF-8"
+        return result
+
+    minified = minify_html(html)
+    if verbatim_blocks(minified) != verbatim_blocks(html):
+        result["status"] = "error"
+        result["message"] = "<pre>/<code> blocks changed; page left as is"
+        return result
+
+    data = minified.encode("utf-8")
+    result["after"] = len(data)
+    result["output"] = content_digest(data)
+    result["status"] = "minified" if data != raw else "unchanged"
+    if data != raw and not dry_run:
+        fs.makedirs(OUTPUT_DIR)
+        if not fs.exists(stored_output_path(result["output"])):
+            fs.write_bytes(stored_output_path(result["output"]), data)
+        fs.write_bytes(path, data)
+    return result
+
+def find_pages(site_dir):
+    for root, _, files in get_fs().walk(site_dir):
+        for fname in files:
+            if fname.endswith(".html"):
+                path = os.path.join(root, fname)
+                yield path, os.path.relpath(path, site_dir)
+
+def load_cache(cache_file=CACHE_FILE):
+    import json
+    try:
+        cache = json.loads(get_fs().read_text(cache_file))
+    except (OSError, ValueError):
+        return {}
+    return {rel: entry for rel, entry in cache.items() if isinstance(entry, dict) and {"input", "output"} <= set(entry)}
+
+def prune_outputs(cache):
+    fs = get_fs()
+    if not fs.isdir(OUTPUT_DIR):
+        return
+    keep = {f"{entry['output']}.html" for entry in cache.values()}
+    for fname in fs.listdir(OUTPUT_DIR):
+        if fname.endswith(".html") and fname not in keep:
+            fs.remove(os.path.join(OUTPUT_DIR, fname))
+
+def summarize(results):
+    summary = {}
+    for r in results:
+        entry = summary.setdefault(r["type"], {"pages": 0, "before": 0, "after": 0})
+        entry["pages"] += 1
+        entry["before"] += r["before"]
+        entry["after"] += r["after"]
+    return summary
+
+def main():
+    parser = get_standard_parser("Minify HTML, inline JSON and inline scripts in the generated _site")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--site-dir", default=SITE_DIR, help="Built site directory")
+    parser.add_argument("--no-cache", action="store_true", help="Process every page regardless of the digest cache")
+    args = parser.parse_args()
+
+    if not get_fs().isdir(args.site_dir):
+        print(f"[warn] No {args.site_dir}/ directory; nothing to minify", file=sys.stderr)
+        return
+
+    cache = {} if args.no_cache else load_cache()
+    tasks = [(path, rel, cache.get(rel), args.dry_run) for path, rel in find_pages(args.site_dir)]
+
+    # Worker processes always see the real disk, so other backends run in-process.
+    if args.jobs > 1 and len(tasks) > 1 and isinstance(get_fs(), DiskFS):
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(process_page, tasks, chunksize=max(1, len(tasks) // (args.jobs * 4))))
+    else:
+        results = [process_page(task) for task in tasks]
+
+    for r in results:
+        if r["status"] == "error":
+            print(f"[warn] {r['path']}: {r['message']}", file=sys.stderr)
+        elif args.verbose and r["status"] != "skipped":
+            prefix = "[dry-run] would minify" if args.dry_run else "[minify]"
+            source = " (stored output)" if r["status"] == "restored" else ""
+            print(f"{prefix} {r['path']}: {r['before']} -> {r['after']} bytes{source}")
+
+    if not args.dry_run:
+        import json
+        new_cache = {r["path"]: {"input": r["input"], "output": r["output"]} for r in results if r["status"] != "error"}
+        ensure_directory(os.path.dirname(CACHE_FILE))
+        write_file_if_changed(CACHE_FILE, json.dumps(new_cache, indent=2, sort_keys=True), quiet=True)
+        prune_outputs(new_cache)
+
+    if not args.quiet:
+        processed = [r for r in results if r["status"] in ("minified", "unchanged", "restored")]
+        restored = sum(1 for r in results if r["status"] == "restored")
+        skipped = sum(1 for r in results if r["status"] == "skipped")
+        errors = len(results) - len(processed) - skipped
+        for page_type, entry in sorted(summarize(processed).items()):
+            saved = entry["before"] - entry["after"]
+            pct = 100.0 * saved / entry["before"] if entry["before"] else 0.0
+            print(f"[info] {page_type}: {entry['pages']} pages, {saved} bytes saved ({pct:.1f}%)")
+        print(
+            f"[info] {len(processed)} pages processed ({restored} from stored output), "
+            f"{skipped} already minified, {errors} left as is"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -7,18 +7,22 @@ consistent structure and formatting for Jekyll and GitHub Pages.
 Features:
 - Backups to _tmpbkup/_posts/
 - Normalizes YAML key order and format
+- Rewrites aliased categories to canonical names (_data/category_aliases.yml)
 - Renames files to YYYY-MM-DD-title.md format
 - Falls back to file timestamp if front matter date missing
+- Limits work to posts changed in git with --since REF / --changed-only
+- Dry runs (-n) fix an in-memory overlay of _posts/ and list the files that would change, with diffs under -v
 """
 
 import os
-import shutil
 import sys
 import re
-from pathlib import Path
-from datetime import datetime
 from jekyll_utilities import (
+    get_fs,
+    run_dry,
     get_standard_parser,
+    get_changed_files_from_args,
+    canonical_category_name,
     load_markdown_files_safe,
     write_markdown_file,
     ensure_directory,
@@ -43,7 +47,10 @@ def normalize_front_matter(post):
                 value = [value]
             elif not isinstance(value, list):
                 value = []
-            fixed[key] = [v.lower() for v in value]
+            value = [v.lower() for v in value]
+            if key == "categories":
+                value = list(dict.fromkeys(canonical_category_name(v) for v in value))
+            fixed[key] = value
 
         elif value is not None:
             fixed[key] = str(value).strip()
@@ -54,34 +61,43 @@ def normalize_front_matter(post):
     return post
 
 def get_date_from_metadata_or_mtime(post, path):
+    from datetime import datetime
     try:
         return datetime.strptime(post.metadata.get("date", ""), "%Y-%m-%d").strftime("%Y-%m-%d")
     except Exception:
-        stat = os.stat(path)
-        return datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d")
+        return datetime.fromtimestamp(get_fs().getmtime(path)).strftime("%Y-%m-%d")
 
 def strip_existing_date_prefix(filename):
     # Remove any date-like prefix: e.g. 2024-09-01-title.md or 20240601-title.md
     return re.sub(r"^\d{4}[-]?\d{2}[-]?\d{2}-", "", filename)
 
-def backup_all_files(src_dir, dst_dir, verbose=False):
+def backup_all_files(src_dir, dst_dir, verbose=False, paths=None):
+    fs = get_fs()
     ensure_directory(dst_dir)
-    for fname in os.listdir(src_dir):
-        if fname.endswith(".md"):
-            src = os.path.join(src_dir, fname)
+    if paths is None:
+        paths = [os.path.join(src_dir, f) for f in fs.listdir(src_dir)]
+    for src in paths:
+        fname = os.path.basename(src)
+        if fname.endswith(".md") and fs.exists(src):
             dst = os.path.join(dst_dir, fname)
-            shutil.copy2(src, dst)
+            fs.copy(src, dst)
             if verbose:
                 print(f"[info] Backed up {fname} to {dst_dir}")
 
-def validate_and_fix_posts(dry_run=False, quiet=False, verbose=False):
-    if not os.path.exists(POSTS_DIR):
+def validate_and_fix_posts(dry_run=False, quiet=False, verbose=False, paths=None):
+    if dry_run:
+        # Same code path against an in-memory overlay; report the resulting diff.
+        run_dry(lambda: validate_and_fix_posts(quiet=True, paths=paths), quiet=quiet, verbose=verbose)
+        return
+
+    fs = get_fs()
+    if not fs.exists(POSTS_DIR):
         print(f"[error] Missing {POSTS_DIR}/ directory", file=sys.stderr)
         sys.exit(1)
 
-    backup_all_files(POSTS_DIR, BACKUP_DIR, verbose=verbose)
+    backup_all_files(POSTS_DIR, BACKUP_DIR, verbose=verbose, paths=paths)
 
-    for path, post in load_markdown_files_safe(POSTS_DIR):
+    for path, post in load_markdown_files_safe(POSTS_DIR, paths=paths):
         original_path = path
         original_name = os.path.basename(path)
 
@@ -93,29 +109,31 @@ def validate_and_fix_posts(dry_run=False, quiet=False, verbose=False):
         new_path = os.path.join(POSTS_DIR, new_name)
 
         if original_name != new_name:
-            if dry_run:
-                print(f"[dry-run] would rename: {original_name} -> {new_name}")
-            else:
-                os.rename(original_path, new_path)
-                path = new_path
-                if not quiet:
-                    print(f"[rename] {original_name} -> {new_name}")
-
-        if dry_run:
+            fs.rename(original_path, new_path)
+            path = new_path
             if not quiet:
-                print(f"[✓] Would fix: {os.path.basename(path)}")
-        else:
-            write_markdown_file(path, post)
-            if verbose:
-                print(f"[✓] Fixed: {os.path.basename(path)}")
+                print(f"[rename] {original_name} -> {new_name}")
+
+        write_markdown_file(path, post)
+        if verbose:
+            print(f"[✓] Fixed: {os.path.basename(path)}")
 
 def main():
     parser = get_standard_parser("Validate and normalize front matter in _posts/*.md")
     args = parser.parse_args()
+
+    paths = None
+    changes = get_changed_files_from_args(args, POSTS_DIR)
+    if changes is not None:
+        paths, _ = changes
+        if args.verbose:
+            print(f"[info] Processing {len(paths)} changed posts.")
+
     validate_and_fix_posts(
         dry_run=args.dry_run,
         quiet=args.quiet,
         verbose=args.verbose,
+        paths=paths,
     )
     
 def derive_new_filename(post, original_path):
@@ -5,6 +5,7 @@ Shared fixtures and helpers for pytest test files in the unattributed-theme proj
 
 import pytest
 import tempfile
+import jekyll_utilities
 from pathlib import Path
 from textwrap import dedent
 
@@ -40,3 +41,20 @@ def temp_archive_dir():
         archive_dir = Path(tempdir) / "_category_pages"
         archive_dir.mkdir(parents=True, exist_ok=True)
         yield archive_dir
+
+
+@pytest.fixture
+def alias_table(tmp_path, monkeypatch):
+    """Point category alias lookups at a small test table instead of _data/category_aliases.yml."""
+    table = tmp_path / "category_aliases.yml"
+    table.write_text("red-team: [redteaming]\ncobalt-strike: [cobaltstrike]\nemail: [mail]\n", encoding="utf-8")
+    monkeypatch.setattr(jekyll_utilities, "CATEGORY_ALIASES_FILE", str(table))
+    return table
+
+
+@pytest.fixture
+def memory_fs():
+    """Route all script I/O to an empty in-memory tree; relative paths like _posts/ resolve inside it."""
+    fs = jekyll_utilities.MemoryFS()
+    with jekyll_utilities.use_fs(fs):
+        yield fs
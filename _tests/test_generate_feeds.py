@@ -0,0 +1,131 @@
+# _tests/test_generate_feeds.py
+
+import xml.dom.minidom
+from textwrap import dedent
+from _scripts import generate_feeds
+
+
+SITE = {
+    "title": "unattributed",
+    "description": "desc",
+    "url": "https://example.org",
+    "baseurl": "",
+    "timezone": "Asia/Bangkok",
+    "author": "",
+}
+
+
+def _write_post(posts_dir, name, title, categories="security", body="Body text."):
+    (posts_dir / name).write_text(dedent(f"""\
+        ---
+        layout: post
+        title: "{title}"
+        date: {name[:10]}
+        author: unattributed
+        categories: [{categories}]
+        tags: [ci]
+        ---
+        {body}
+    """), encoding="utf-8")
+
+
+def _site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    posts = tmp_path / "_posts"
+    posts.mkdir()
+    pages = tmp_path / "_category_pages"
+    pages.mkdir()
+    (pages / "security-archive.md").write_text(
+        "---\nlayout: archive\npermalink: /security-archive.html\ncategory: security\n---\n", encoding="utf-8")
+    (tmp_path / "about.md").write_text("---\ntitle: about\n---\nAbout.\n", encoding="utf-8")
+    (tmp_path / "NOTES.md").write_text("No front matter.\n", encoding="utf-8")
+    _write_post(posts, "2024-01-01-first.md", "First")
+    _write_post(posts, "2024-02-01-second.md", "Second", body="See {% post_url 2024-01-01-first %}.")
+    return posts
+
+
+def test_feed_and_sitemap_structure(tmp_path, monkeypatch):
+    _site(tmp_path, monkeypatch)
+    entries, rendered = generate_feeds.update_entries({}, SITE)
+    assert len(rendered) == 4
+
+    feed = generate_feeds.build_feed(entries, SITE)
+    sitemap = generate_feeds.build_sitemap(entries)
+    xml.dom.minidom.parseString(feed)
+    xml.dom.minidom.parseString(sitemap)
+
+    assert feed.index("Second") < feed.index("First")
+    assert "<updated>2024-02-01T00:00:00+07:00</updated>" in feed
+    assert "See /security/2024/01/01/first.html." in entries["_posts/2024-02-01-second.md"]["feed"]
+    assert "<loc>https://example.org/security-archive.html</loc>" in sitemap
+    assert "<loc>https://example.org/about.html</loc>" in sitemap
+    assert "NOTES" not in sitemap
+
+
+def test_only_changed_posts_are_rerendered(tmp_path, monkeypatch):
+    posts = _site(tmp_path, monkeypatch)
+    entries, _ = generate_feeds.update_entries({}, SITE)
+
+    again, rendered = generate_feeds.update_entries(entries, SITE)
+    assert rendered == []
+    assert again == entries
+
+    _write_post(posts, "2024-02-01-second.md", "Second edited")
+    _, rendered = generate_feeds.update_entries(entries, SITE)
+    assert rendered == ["_posts/2024-02-01-second.md"]
+
+
+def test_posts_linking_to_a_moved_post_are_rerendered(tmp_path, monkeypatch):
+    posts = _site(tmp_path, monkeypatch)
+    entries, _ = generate_feeds.update_entries({}, SITE)
+
+    _write_post(posts, "2024-01-01-first.md", "First", categories="privacy")
+    updated, rendered = generate_feeds.update_entries(entries, SITE)
+    assert sorted(rendered) == ["_posts/2024-01-01-first.md", "_posts/2024-02-01-second.md"]
+    assert "/privacy/2024/01/01/first.html" in updated["_posts/2024-02-01-second.md"]["feed"]
+
+
+def test_deleted_posts_are_dropped(tmp_path, monkeypatch):
+    posts = _site(tmp_path, monkeypatch)
+    entries, _ = generate_feeds.update_entries({}, SITE)
+    (posts / "2024-01-01-first.md").unlink()
+    updated, _ = generate_feeds.update_entries(entries, SITE)
+    assert "_posts/2024-01-01-first.md" not in updated
+
+
+def test_unparseable_date_falls_back_to_filename(tmp_path, monkeypatch, capsys):
+    posts = _site(tmp_path, monkeypatch)
+    (posts / "2024-03-01-bad.md").write_text(
+        "---\ntitle: Bad\ndate: \"2024-13-45\"\ncategories: [security]\nlast_modified_at: never\n---\nBody.\n", encoding="utf-8")
+    entries, _ = generate_feeds.update_entries({}, SITE)
+    entry = entries["_posts/2024-03-01-bad.md"]
+    assert entry["url"] == "/security/2024/03/01/bad.html"
+    assert "<published>2024-03-01T00:00:00+07:00</published>" in entry["feed"]
+    assert "<updated>2024-03-01T00:00:00+07:00</updated>" in entry["feed"]
+    assert "unparseable date 2024-13-45" in capsys.readouterr().err
+
+
+def test_unpublished_and_future_posts_are_left_out(tmp_path, monkeypatch):
+    from datetime import datetime, timezone
+    posts = _site(tmp_path, monkeypatch)
+    (posts / "2024-03-01-draft.md").write_text(
+        "---\ntitle: Draft\ndate: 2024-03-01\npublished: false\ncategories: [security]\n---\nBody.\n", encoding="utf-8")
+    _write_post(posts, "2099-01-01-scheduled.md", "Scheduled")
+
+    entries, rendered = generate_feeds.update_entries({}, SITE)
+    assert "_posts/2024-03-01-draft.md" not in entries
+    assert "_posts/2099-01-01-scheduled.md" not in entries
+    assert sorted(rendered) == sorted(entries)
+    assert "Scheduled" not in generate_feeds.build_feed(entries, SITE)
+    assert "scheduled" not in generate_feeds.build_sitemap(entries)
+
+    # Left-out posts are not cached, so a later run picks the scheduled post up once its date passes.
+    again, rendered = generate_feeds.update_entries(entries, SITE)
+    assert rendered == [] and again == entries
+    later = datetime(2099, 1, 2, tzinfo=timezone.utc)
+    again, rendered = generate_feeds.update_entries(entries, SITE, now=later)
+    assert rendered == ["_posts/2099-01-01-scheduled.md"]
+    assert "_posts/2024-03-01-draft.md" not in again
+
+    future, _ = generate_feeds.update_entries({}, dict(SITE, future=True))
+    assert "_posts/2099-01-01-scheduled.md" in future
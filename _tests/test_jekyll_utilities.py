@@ -17,23 +17,183 @@ def test_normalize_category_name():
 def test_build_category_permalink():
     assert jekyll_utilities.build_category_permalink("DevOps") == "/devops-archive.html"
 
-def test_write_file_if_changed_dry_run_and_json(tmp_path):
+def test_write_file_if_changed_and_json(tmp_path):
     test_file = tmp_path / "test.json"
     content = '{"key": "value"}'
 
     # First write (should happen)
-    changed, message = jekyll_utilities.write_file_if_changed(str(test_file), content, dry_run=True, quiet=False)
+    changed, message = jekyll_utilities.write_file_if_changed(str(test_file), content, quiet=True)
     assert changed
-    assert "would write" in message
+    assert message == f"[write] {test_file}"
+    assert test_file.read_text() == content
 
     # Second write (no change)
-    test_file.write_text(content)
-    changed, message = jekyll_utilities.write_file_if_changed(str(test_file), content, dry_run=True, quiet=True)
+    changed, message = jekyll_utilities.write_file_if_changed(str(test_file), content, quiet=True)
     assert not changed
 
+    with pytest.raises(ValueError):
+        jekyll_utilities.write_file_if_changed(str(test_file), "{", quiet=True)
+
 def test_get_standard_parser_flags_and_defaults():
     parser = jekyll_utilities.get_standard_parser()
     args = parser.parse_args([])
     assert not args.dry_run
     assert not args.quiet
     assert not args.verbose
+
+def _git(cwd, *args):
+    import subprocess
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+def test_get_changed_files_reports_added_renamed_and_deleted(tmp_path, monkeypatch):
+    posts = tmp_path / "_posts"
+    posts.mkdir()
+    (posts / "2024-01-01-keep.md").write_text("---\ntitle: Keep\n---\n")
+    (posts / "2024-01-02-old.md").write_text("---\ntitle: Old name with enough body to match\n---\nbody\n")
+    (posts / "2024-01-03-gone.md").write_text("---\ntitle: Gone\n---\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+
+    _git(tmp_path, "mv", "_posts/2024-01-02-old.md", "_posts/2024-01-02-new.md")
+    (posts / "2024-01-03-gone.md").unlink()
+    (posts / "2024-01-04-added.md").write_text("---\ntitle: Added\n---\n")
+
+    monkeypatch.chdir(tmp_path)
+    changed, deleted = jekyll_utilities.get_changed_files("_posts")
+    assert changed == [os.path.join("_posts", "2024-01-02-new.md"), os.path.join("_posts", "2024-01-04-added.md")]
+    assert deleted == [os.path.join("_posts", "2024-01-02-old.md"), os.path.join("_posts", "2024-01-03-gone.md")]
+    assert "Gone" in jekyll_utilities.read_file_at_ref(os.path.join("_posts", "2024-01-03-gone.md"))
+
+def test_get_changed_files_falls_back_outside_git(tmp_path, monkeypatch):
+    (tmp_path / "_posts").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    assert jekyll_utilities.get_changed_files("_posts") is None
+
+def test_get_changed_files_from_args_without_flags_is_full_run():
+    args = jekyll_utilities.get_standard_parser().parse_args([])
+    assert jekyll_utilities.get_changed_files_from_args(args, "_posts") is None
+
+def test_category_aliases_resolve_to_canonical(tmp_path):
+    table = tmp_path / "category_aliases.yml"
+    table.write_text("red-team: [redteaming, Red Teaming]\nemail: mail\n")
+    aliases = jekyll_utilities.load_category_aliases(str(table))
+    assert aliases["redteaming"] == "red-team"
+    assert aliases["red-teaming"] == "red-team"
+    assert aliases["mail"] == "email"
+
+def test_normalize_category_name_uses_alias_table(alias_table):
+    assert jekyll_utilities.normalize_category_name("RedTeaming") == "red-team"
+    assert jekyll_utilities.build_category_permalink("cobaltstrike") == "/cobalt-strike-archive.html"
+
+def test_overlay_fs_keeps_changes_in_memory(tmp_path):
+    (tmp_path / "keep.md").write_text("keep")
+    (tmp_path / "old.md").write_text("old")
+    overlay = jekyll_utilities.OverlayFS(jekyll_utilities.DiskFS())
+    overlay.write_text(str(tmp_path / "keep.md"), "changed")
+    overlay.rename(str(tmp_path / "old.md"), str(tmp_path / "new.md"))
+    overlay.makedirs(str(tmp_path / "sub"))
+    overlay.write_text(str(tmp_path / "sub" / "a.md"), "a")
+
+    assert overlay.read_text(str(tmp_path / "keep.md")) == "changed"
+    assert sorted(overlay.listdir(str(tmp_path))) == ["keep.md", "new.md", "sub"]
+    assert not overlay.exists(str(tmp_path / "old.md"))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["keep.md", "old.md"]
+    assert (tmp_path / "keep.md").read_text() == "keep"
+    assert [(status, path[len(str(tmp_path)) + 1:]) for status, path in overlay.changes()] == [
+        ("modified", "keep.md"), ("added", "new.md"), ("deleted", "old.md"), ("added", "sub/a.md"),
+    ]
+
+def test_memory_fs_walk_and_missing_parent():
+    fs = jekyll_utilities.MemoryFS({"_site/index.html": "<p>", "_site/2025/01/01/post.html": b"<p>"})
+    assert [(root, files) for root, _, files in fs.walk("_site")] == [
+        ("_site", ["index.html"]), ("_site/2025", []), ("_site/2025/01", []), ("_site/2025/01/01", ["post.html"]),
+    ]
+    with pytest.raises(FileNotFoundError):
+        fs.write_text("missing/dir.md", "x")
+
+def test_run_dry_reports_writes_and_skips_backups(memory_fs, capsys):
+    memory_fs.makedirs("_posts")
+    memory_fs.write_text("_posts/a.md", "a")
+
+    def run():
+        jekyll_utilities.ensure_directory("_tmpbkup/_posts")
+        jekyll_utilities.get_fs().copy("_posts/a.md", "_tmpbkup/_posts/a.md")
+        jekyll_utilities.write_file_if_changed("_posts/a.md", "b", quiet=True)
+
+    _, changes = jekyll_utilities.run_dry(run)
+    assert changes == [("modified", "_posts/a.md")]
+    assert capsys.readouterr().out == "[dry-run] would write: _posts/a.md\n"
+    assert memory_fs.read_text("_posts/a.md") == "a"
+    assert not memory_fs.exists("_tmpbkup")
+
+def test_run_dry_verbose_prints_diff(memory_fs, capsys):
+    memory_fs.makedirs("_posts")
+    memory_fs.write_text("_posts/a.md", "title: a\nbody\n")
+
+    def run():
+        jekyll_utilities.write_file_if_changed("_posts/a.md", "title: b\nbody\n", quiet=True)
+        jekyll_utilities.write_file_if_changed("_posts/new.md", "new\n", quiet=True)
+
+    jekyll_utilities.run_dry(run, verbose=True)
+    assert capsys.readouterr().out.splitlines() == [
+        "[dry-run] would write: _posts/a.md",
+        "--- a/_posts/a.md", "+++ b/_posts/a.md", "@@ -1,2 +1,2 @@", "-title: a", "+title: b", " body",
+        "[dry-run] would write: _posts/new.md",
+        "--- a/_posts/new.md", "+++ b/_posts/new.md", "@@ -0,0 +1 @@", "+new",
+    ]
+
+def test_missing_alias_table_warns(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(jekyll_utilities, "CATEGORY_ALIASES_FILE", str(tmp_path / "missing.yml"))
+    assert jekyll_utilities.normalize_category_name("RedTeaming") == "redteaming"
+    assert "[warn] No category alias table" in capsys.readouterr().err
+
+@pytest.mark.parametrize("raw", [
+    "---\ncategories: [a, b]\n---\n",
+    "---\ncategories : [a, b]\n---\n",
+    "---\ncategories:\n  - a\n  - b\n---\n",
+    "---\n\"categories\": [a, b]\n---\n",
+])
+def test_read_front_matter_list_matches_yaml(raw):
+    assert jekyll_utilities.read_front_matter_list(raw, "categories") == ["a", "b"]
+    assert jekyll_utilities.read_front_matter_list(raw, "tags") == []
+
+@pytest.mark.parametrize("raw", [
+    "---\ntitle: x\n  categories: [q]\n---\n",
+    "---\ncategories: [a]\ntitle: a: b\n---\n",
+])
+def test_read_front_matter_list_rejects_invalid_yaml(raw):
+    import yaml
+    with pytest.raises(yaml.YAMLError):
+        jekyll_utilities.read_front_matter_list(raw, "categories")
+
+def test_category_aliases_are_read_from_memory_fs(memory_fs):
+    memory_fs.makedirs("_data")
+    memory_fs.write_text("_data/category_aliases.yml", "red-team: [redteaming]\n")
+    assert jekyll_utilities.canonical_category_name("redteaming") == "red-team"
+
+    memory_fs.write_text("_data/category_aliases.yml", "red-team: [redteaming]\nemail: [mail]\n")
+    assert jekyll_utilities.canonical_category_name("mail") == "email"
+
+def test_overlay_alias_edits_are_seen_and_overlays_are_released(tmp_path, monkeypatch):
+    import gc
+    import weakref
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "_data").mkdir()
+    (tmp_path / "_data" / "category_aliases.yml").write_text("red-team: [redteaming]\n")
+    seen = []
+
+    def run():
+        fs = jekyll_utilities.get_fs()
+        seen.append(weakref.ref(fs))
+        assert jekyll_utilities.canonical_category_name("mail") == "mail"
+        fs.write_text("_data/category_aliases.yml", "email: [mail]\n")
+        return jekyll_utilities.canonical_category_name("mail")
+
+    result, changes = jekyll_utilities.run_dry(run, quiet=True)
+    assert result == "email"
+    assert changes == [("modified", "_data/category_aliases.yml")]
+    assert jekyll_utilities.canonical_category_name("mail") == "mail"
+    gc.collect()
+    assert seen[0]() is None
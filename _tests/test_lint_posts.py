@@ -0,0 +1,88 @@
+# _tests/test_lint_posts.py
+
+from _scripts import lint_posts
+
+
+def _post(path, title="Post", date="2024-01-01", categories=("security",), content=""):
+    metadata = {"title": title, "date": date, "categories": list(categories)}
+    return (path, metadata, content)
+
+
+def _index(posts, tmp_path, categories=("security",)):
+    archive_dir = tmp_path / "_category_pages"
+    archive_dir.mkdir()
+    for cat in categories:
+        (archive_dir / f"{cat}-archive.md").write_text(f"---\nlayout: archive\ncategory: {cat}\n---\n")
+    return lint_posts.build_index(posts, category_dir=str(archive_dir), site_host="unattributed.blog")
+
+
+def _rules(findings):
+    return sorted(f["rule"] for f in findings)
+
+
+def test_build_post_url_uses_categories_and_date():
+    url = lint_posts.build_post_url("2024-01-01-hello.md", {"date": "2024-01-01", "categories": ["Security", "AI"]})
+    assert url == "/security/ai/2024/01/01/hello.html"
+
+
+def test_build_post_url_prefers_front_matter_permalink(tmp_path):
+    metadata = {"date": "2024-01-01", "categories": ["security"], "permalink": "/notes/hello.html"}
+    assert lint_posts.build_post_url("2024-01-01-hello.md", metadata) == "/notes/hello.html"
+
+    posts = [
+        ("_posts/2024-01-01-hello.md", dict(metadata, title="Hello"), ""),
+        _post("_posts/2024-01-02-b.md", title="B", date="2024-01-02", content="[a](/notes/hello.html)"),
+    ]
+    index = _index(posts, tmp_path)
+    assert "/notes/hello.html" in index["post_urls"]
+    assert lint_posts.lint_posts(posts, index) == []
+
+
+def test_clean_posts_have_no_findings(tmp_path):
+    posts = [
+        _post("_posts/2024-01-01-a.md", title="A", content="[b]({% post_url 2024-01-02-b %}) [s](/security-archive.html)"),
+        _post("_posts/2024-01-02-b.md", title="B", date="2024-01-02",
+              content="[a](https://unattributed.blog/security/2024/01/01/a.html) [x](https://example.com/x-archive.html)"),
+    ]
+    index = _index(posts, tmp_path)
+    assert lint_posts.lint_posts(posts, index) == []
+
+
+def test_each_rule_reports_its_finding(tmp_path):
+    posts = [
+        _post("_posts/2024-01-01-a.md", title="Same", content="{% post_url 2024-09-09-missing %} [x](/nope-archive.html)"),
+        _post("_posts/2024-01-02-b.md", title="same", date="2024-01-03", categories=["unknown"]),
+        _post("_posts/2024-01-04-c.md", title="C", date="not-a-date", content="[p](/security/2023/01/01/gone.html)"),
+    ]
+    index = _index(posts, tmp_path)
+    findings = lint_posts.lint_posts(posts, index)
+    assert _rules(findings) == [
+        "broken-link", "broken-link", "broken-link",
+        "duplicate-title", "duplicate-title",
+        "malformed-date", "malformed-date",
+        "missing-category-page",
+    ]
+
+
+def test_paths_limit_linted_posts_but_not_index(tmp_path):
+    posts = [
+        _post("_posts/2024-01-01-a.md", content="{% post_url 2024-01-02-b %}"),
+        _post("_posts/2024-01-02-b.md", title="B", date="2024-01-02", categories=["unknown"]),
+    ]
+    index = _index(posts, tmp_path)
+    assert lint_posts.lint_posts(posts, index, paths=["_posts/2024-01-01-a.md"]) == []
+
+
+def test_parallel_matches_serial(tmp_path):
+    posts = [_post(f"_posts/2024-01-{d:02d}-p{d}.md", title="dup", date=f"2024-01-{d:02d}") for d in range(1, 9)]
+    index = _index(posts, tmp_path)
+    assert lint_posts.lint_posts(posts, index, jobs=2) == lint_posts.lint_posts(posts, index)
+
+
+def test_category_alias_rule_flags_non_canonical_names(tmp_path, alias_table):
+    posts = [_post("_posts/2024-01-01-a.md", categories=["redteaming"])]
+    index = _index(posts, tmp_path, categories=("red-team",))
+    findings = lint_posts.lint_posts(posts, index)
+    assert [(f["rule"], f["message"]) for f in findings] == [
+        ("category-alias", "category redteaming is an alias of red-team"),
+    ]
@@ -8,4 +8,50 @@ def test_normalize_category_name():
     assert manage_archives.normalize_category_name("Web-App") == "web-app"
 
 def test_build_category_permalink():
-    assert manage_archives.build_category_permalink("DevOps") == "/devops-archive.html"
\ No newline at end of file
+    assert manage_archives.build_category_permalink("DevOps") == "/devops-archive.html"
+
+def test_name_similarity_handles_separators_abbreviations_and_subtopics():
+    assert manage_archives.name_similarity("cobaltstrike", "cobalt-strike") == 1.0
+    assert manage_archives.name_similarity("pentesting", "penetration-testing") >= 0.8
+    assert manage_archives.name_similarity("security", "ai-security") == 0.0
+    assert manage_archives.name_similarity("email-security", "ai-security") < 0.6
+
+
+def test_suggest_category_aliases_prefers_widely_used_name():
+    posts_by_category = {
+        "red-team": {"a.md", "b.md", "c.md"},
+        "redteaming": {"d.md"},
+        "mail": {"e.md"},
+        "email": {"f.md", "g.md"},
+        "dns": {"h.md"},
+        "ddns": {"i.md"},
+        "security": {"j.md"},
+        "ai-security": {"k.md"},
+    }
+    suggestions = manage_archives.suggest_category_aliases(posts_by_category, aliases={})
+    assert [(alias, canonical) for alias, canonical, _, _ in suggestions] == [
+        ("redteaming", "red-team"),
+        ("mail", "email"),
+    ]
+    assert manage_archives.suggest_category_aliases(posts_by_category, aliases={"redteaming": "red-team", "mail": "email"}) == []
+
+
+def test_categories_from_raw_resolves_aliases(alias_table):
+    raw = "---\ncategories: [redteaming, cobalt-strike]\n---\n"
+    assert manage_archives.categories_from_raw(raw) == ["red-team", "cobalt-strike"]
+    assert manage_archives.categories_from_raw(raw, resolve_aliases=False) == ["redteaming", "cobalt-strike"]
+
+def test_update_archives_on_synthetic_tree(memory_fs):
+    memory_fs.makedirs("_posts")
+    memory_fs.makedirs("_category_pages")
+    for i in range(500):
+        memory_fs.write_text(f"_posts/2025-01-01-post-{i}.md", f"---\ntitle: Post {i}\ncategories: [topic-{i % 25}]\n---\nBody.\n")
+    memory_fs.write_text("_category_pages/stale-archive.md", "---\ncategory: stale\n---\n")
+    args = manage_archives.get_standard_parser().parse_args(["-q", "-f"])
+
+    manage_archives.update_archives(args)
+
+    pages = memory_fs.listdir("_category_pages")
+    assert len(pages) == 25 and "stale-archive.md" not in pages
+    assert 'permalink: /topic-7-archive.html' in memory_fs.read_text("_category_pages/topic-7-archive.md")
+    assert memory_fs.read_text("_tmpbkup/_category_pages/stale-archive.md").startswith("---")
@@ -0,0 +1,115 @@
+# _tests/test_minify_site.py
+
+import pytest
+from textwrap import dedent
+from _scripts import minify_site
+
+
+PAGE = dedent("""\
+    <!DOCTYPE html>
+    <html lang="en">
+      <head>
+        <!-- layout comment -->
+        <title>Post</title>
+        <script type="application/ld+json">
+          {"name": "x", "list": [1, 2]}
+        </script>
+      </head>
+      <body>
+        <p>Hello   <b>bold</b> <i>italic</i>
+        world</p>
+    <pre class="highlight"><code>  keep
+        this   spacing</code></pre>
+        <p>inline <code>a  =  1</code></p>
+      </body>
+    </html>
+""")
+
+
+def test_minify_html_removes_comments_and_whitespace():
+    out = minify_site.minify_html(PAGE)
+    assert "layout comment" not in out
+    assert "<head><title>Post</title>" in out
+    assert "<p>Hello <b>bold</b> <i>italic</i> world</p>" in out
+    assert '{"name":"x","list":[1,2]}' in out
+    assert len(out) < len(PAGE)
+
+
+def test_minify_html_keeps_pre_and_code_verbatim():
+    out = minify_site.minify_html(PAGE)
+    assert minify_site.verbatim_blocks(out) == minify_site.verbatim_blocks(PAGE)
+
+
+def test_minify_js_keeps_strings_regex_and_asi_newlines():
+    code = dedent("""\
+        // comment
+        var url = "http://x // y";
+        var re = /a  b/g;
+        a = b
+        ++c
+        window.posts = [
+          { title: "A" },
+        ];
+    """)
+    out = minify_site.minify_js(code)
+    assert '"http://x // y"' in out
+    assert "/a  b/g" in out
+    assert "a=b\n++c" in out
+    assert 'window.posts=[{title:"A"},];' in out
+
+
+def test_classify_page():
+    assert minify_site.classify_page("search.html") == "search"
+    assert minify_site.classify_page("java-archive.html") == "archive"
+    assert minify_site.classify_page("java/2025/05/12/post.html") == "post"
+    assert minify_site.classify_page("index.html") == "index"
+    assert minify_site.classify_page("about.html") == "page"
+
+
+def _cache_entry(result):
+    return {"input": result["input"], "output": result["output"]}
+
+
+def test_process_page_writes_and_skips_cached_digest(memory_fs):
+    memory_fs.makedirs("_site")
+    memory_fs.write_text("_site/index.html", PAGE)
+
+    result = minify_site.process_page(("_site/index.html", "index.html", None, False))
+    assert result["status"] == "minified"
+    assert result["after"] < result["before"]
+    assert memory_fs.read_text("_site/index.html") == minify_site.minify_html(PAGE)
+
+    again = minify_site.process_page(("_site/index.html", "index.html", _cache_entry(result), False))
+    assert again["status"] == "skipped"
+    assert _cache_entry(again) == _cache_entry(result)
+
+
+def test_rebuilt_page_is_restored_without_minifying(memory_fs, monkeypatch):
+    memory_fs.makedirs("_site")
+    memory_fs.write_text("_site/index.html", PAGE)
+    first = minify_site.process_page(("_site/index.html", "index.html", None, False))
+
+    # jekyll build writes the unminified page again; the stored output is reused.
+    memory_fs.write_text("_site/index.html", PAGE)
+    monkeypatch.setattr(minify_site, "minify_html", lambda html: pytest.fail("page was minified again"))
+    result = minify_site.process_page(("_site/index.html", "index.html", _cache_entry(first), False))
+    assert result["status"] == "restored"
+    assert _cache_entry(result) == _cache_entry(first)
+    assert memory_fs.read_bytes("_site/index.html") == memory_fs.read_bytes(minify_site.stored_output_path(first["output"]))
+
+
+def test_process_page_dry_run_leaves_file(memory_fs):
+    memory_fs.makedirs("_site")
+    memory_fs.write_text("_site/index.html", PAGE)
+    result = minify_site.process_page(("_site/index.html", "index.html", None, True))
+    assert result["status"] == "minified"
+    assert memory_fs.read_text("_site/index.html") == PAGE
+    assert not memory_fs.exists(minify_site.OUTPUT_DIR)
+
+
+def test_prune_outputs_keeps_referenced_pages(memory_fs):
+    memory_fs.makedirs(minify_site.OUTPUT_DIR)
+    for digest in ("keep", "stale"):
+        memory_fs.write_text(minify_site.stored_output_path(digest), "<p>")
+    minify_site.prune_outputs({"index.html": {"input": "a", "output": "keep"}})
+    assert memory_fs.listdir(minify_site.OUTPUT_DIR) == ["keep.html"]
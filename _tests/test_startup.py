@@ -0,0 +1,79 @@
+# _tests/test_startup.py
+"""
+Cold-start guards for the content scripts, measured with `python -X importtime`.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "_scripts"
+SCRIPTS = ["manage_archives", "validate_and_fix_posts", "lint_posts", "minify_site", "generate_feeds"]
+# Import cost relative to `import argparse, re` in the same run, so slower runners scale both
+# sides. Scripts measure 1.7-2.5x and a stray yaml import adds 2-3x; HEAVY_MODULES is the
+# strict guard against new eager imports, this ratio only catches gross regressions.
+IMPORT_BUDGET_RATIO = 5
+HEAVY_MODULES = {"yaml", "json", "datetime", "subprocess", "hashlib", "concurrent.futures", "markdown"}
+
+
+def _importtime(args, cwd):
+    """Run python -X importtime and return ({module: cumulative_us}, stdout)."""
+    env = dict(os.environ, PYTHONPATH=str(SCRIPTS_DIR))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd, env=env, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules, result.stdout
+
+
+def _tree(tmp_path):
+    posts = tmp_path / "_posts"
+    posts.mkdir()
+    (tmp_path / "_category_pages").mkdir()
+    (posts / "2024-01-01-hello.md").write_text(
+        "---\nlayout: post\ntitle: \"Hello\"\ndate: 2024-01-01\nauthor: a\ncategories: [devops]\ntags: [ci]\n---\nBody.\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "_config.yml").write_text("title: t\nurl: \"https://example.org\"\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_import_time_within_budget(script, tmp_path):
+    # Best of three, interleaved with the baseline, so a cold .pyc cache or a busy runner
+    # affects both measurements alike. argparse imports re, so its cumulative time covers both.
+    baseline, best = [], []
+    for _ in range(3):
+        baseline.append(_importtime(["-c", "import argparse, re"], tmp_path)[0]["argparse"])
+        best.append(_importtime(["-c", f"import {script}"], tmp_path)[0][script])
+    assert min(best) / min(baseline) < IMPORT_BUDGET_RATIO
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_import_does_not_load_heavy_modules(script, tmp_path):
+    modules, _ = _importtime(["-c", f"import {script}"], tmp_path)
+    assert not HEAVY_MODULES & set(modules)
+
+
+def test_list_new_does_not_import_heavy_modules(tmp_path):
+    modules, stdout = _importtime([str(SCRIPTS_DIR / "manage_archives.py"), "--list-new"], _tree(tmp_path))
+    assert "[new] devops-archive.md" in stdout
+    assert not HEAVY_MODULES & set(modules)
+
+
+def test_cached_feed_run_only_loads_json(tmp_path):
+    cwd = _tree(tmp_path)
+    script = str(SCRIPTS_DIR / "generate_feeds.py")
+    _importtime([script, "-q"], cwd)
+    modules, _ = _importtime([script, "-v"], cwd)
+    assert not (HEAVY_MODULES - {"json", "hashlib"}) & set(modules)
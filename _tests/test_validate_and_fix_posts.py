@@ -87,3 +87,28 @@ def test_parse_sanitized_yaml_and_write_markdown_file(tmp_path):
     output_contents = output_file.read_text(encoding="utf-8")
     assert "title: \"Hello World\"" in output_contents
     assert "author: bar" in output_contents
+
+
+def test_normalize_front_matter_rewrites_category_aliases(sample_front_matter, alias_table):
+    post = type("Post", (), {})()
+    post.metadata = sample_front_matter.copy()
+    post.metadata["categories"] = ["RedTeaming", "red-team", "Mail"]
+    normalized = validate_and_fix_posts.normalize_front_matter(post).metadata
+    assert normalized["categories"] == ["red-team", "email"]
+
+def test_validate_and_fix_posts_dry_run_uses_overlay(memory_fs, capsys):
+    memory_fs.makedirs("_posts")
+    memory_fs.write_text("_posts/hello.md", "---\ntitle: Hello\ndate: 2024-03-05\ncategories: [Security]\n---\nBody\n")
+
+    validate_and_fix_posts.validate_and_fix_posts(dry_run=True)
+
+    assert capsys.readouterr().out.splitlines() == [
+        "[dry-run] would write: _posts/2024-03-05-hello.md",
+        "[dry-run] would delete: _posts/hello.md",
+    ]
+    assert memory_fs.listdir("_posts") == ["hello.md"]
+    assert not memory_fs.exists("_tmpbkup")
+
+    validate_and_fix_posts.validate_and_fix_posts(quiet=True)
+    assert memory_fs.listdir("_posts") == ["2024-03-05-hello.md"]
+    assert "categories: [security]" in memory_fs.read_text("_posts/2024-03-05-hello.md")